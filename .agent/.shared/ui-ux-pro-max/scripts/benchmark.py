@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Benchmark - BM25 query throughput
+Usage: python benchmark.py [--docs 100000] [--repeat 3] [--json]
+       python benchmark.py --tokenizer [--repeat 3] [--json]
+       python benchmark.py --tune [--json]
+
+Times top-3 queries with the postings-based BM25.score against the
+previous full-corpus scan, and the whole query set as one score_many
+batch on the NumPy/SciPy backend (when installed), on the largest bundled
+CSVs and on a synthetic corpus built from their vocabulary; also the
+uncached typo/prefix expansion of a misspelled word.
+
+--tokenizer compares the tokenizer against the previous one (re.sub +
+split + length filter): throughput over every bundled document, and
+relevance as the mean reciprocal rank of each row when searched by its
+own keywords with singular/plural flipped, for the single-field
+documents and for the per-column BM25F fields with CSV_CONFIG's weights;
+also searching each row by its name column.
+
+--tune searches the BM25F field weights that maximize those MRRs (name
+queries, plus keyword queries where a Keywords column exists).
+"""
+
+import re
+import time
+import random
+import argparse
+import json
+from collections import defaultdict
+
+from core import (BM25, CSV_CONFIG, DATA_DIR, MAX_RESULTS, NUMPY_AVAILABLE, STACK_CONFIG, _STACK_COLS,
+                  _index_targets, _load_csv)
+
+QUERIES = [
+    "glassmorphism dark mode", "saas dashboard analytics", "fintech trust secure",
+    "accessibility contrast wcag", "animation loading skeleton", "ecommerce luxury minimal",
+    "healthcare calm clean", "button hover state", "form validation error",
+    "elegant serif heading", "chart trend time series", "landing hero cta",
+    "mobile touch target", "gaming neon vibrant", "pricing table comparison",
+]
+
+# The column naming each row, searched for in the relevance checks
+NAME_COLUMNS = {
+    "style": "Style Category", "prompt": "Style Category", "color": "Product Type", "chart": "Data Type",
+    "landing": "Pattern Name", "product": "Product Type", "ux": "Issue", "typography": "Font Pairing Name",
+    "icons": "Icon Name", "react": "Issue", "web": "Issue", "stack": "Guideline",
+}
+# Weights tried per column by --tune
+FIELD_WEIGHT_GRID = [0.5, 1, 1.5, 2, 3]
+
+# Misspelled and truncated words, expanded through the trigram index
+TYPO_QUERIES = ["glasmorphism", "dashbord", "accesibility", "minimalsm", "neumorph", "brutlism", "typograpy", "anim"]
+
+
+def full_scan_score(bm25, query):
+    """The previous BM25.score: every document, term counts rebuilt per query, full sort"""
+    query_tokens = bm25.tokenize(query)
+    scores = []
+    for idx, doc in enumerate(bm25.corpus):
+        score = 0
+        doc_len = bm25.doc_lengths[idx]
+        term_freqs = defaultdict(int)
+        for word in doc:
+            term_freqs[word] += 1
+        for token in query_tokens:
+            if token in bm25.idf:
+                tf = term_freqs[token]
+                numerator = tf * (bm25.k1 + 1)
+                denominator = tf + bm25.k1 * (1 - bm25.b + bm25.b * doc_len / bm25.avgdl)
+                score += bm25.idf[token] * numerator / denominator
+        scores.append((idx, score))
+    return sorted(scores, key=lambda x: x[1], reverse=True)
+
+
+def csv_corpora(count=3):
+    """Documents of the largest searchable CSVs, as _search_csv builds them"""
+    targets = sorted({t[0]: t for t in _index_targets() if t[0].exists()}.values(),
+                     key=lambda t: t[0].stat().st_size, reverse=True)
+    corpora = {}
+    for filepath, search_cols, *_ in targets[:count]:
+        rows = _load_csv(filepath)
+        corpora[str(filepath.relative_to(DATA_DIR))] = [
+            " ".join(str(row.get(col, "")) for col in search_cols) for row in rows
+        ]
+    return corpora
+
+
+def synthetic_corpus(size, seed=0):
+    """Random documents over the bundled vocabulary, word frequencies kept"""
+    words = []
+    for documents in csv_corpora(count=len(_index_targets())).values():
+        for document in documents:
+            words.extend(BM25().tokenize(document))
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(words, k=rng.randint(10, 40))) for _ in range(size)]
+
+
+def time_queries(score, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in QUERIES:
+            score(query)
+    return (time.perf_counter() - start) / (repeat * len(QUERIES)) * 1000
+
+
+def bench(name, documents, repeat):
+    start = time.perf_counter()
+    bm25 = BM25()
+    bm25.fit(documents)
+    fit_ms = (time.perf_counter() - start) * 1000
+
+    results = {"corpus": name, "docs": len(documents), "fit_ms": round(fit_ms, 1)}
+    results["full_scan_ms"] = round(time_queries(lambda q: full_scan_score(bm25, q)[:MAX_RESULTS], repeat), 3)
+    results["postings_ms"] = round(time_queries(lambda q: bm25.score(q, top_k=MAX_RESULTS), repeat), 3)
+    results["speedup"] = round(results["full_scan_ms"] / results["postings_ms"], 1) if results["postings_ms"] else None
+
+    # Uncached: the expansion cache is emptied before every pass
+    start = time.perf_counter()
+    for _ in range(repeat):
+        bm25._expansions = {}
+        for word in TYPO_QUERIES:
+            bm25.expand(word)
+    results["expand_ms"] = round((time.perf_counter() - start) / (repeat * len(TYPO_QUERIES)) * 1000, 3)
+
+    results["batch_numpy_ms"] = None
+    if NUMPY_AVAILABLE:
+        start = time.perf_counter()
+        bm25.score_many(QUERIES[:1], top_k=MAX_RESULTS, backend="numpy")
+        results["matrix_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            bm25.score_many(QUERIES, top_k=MAX_RESULTS, backend="numpy")
+        results["batch_numpy_ms"] = round((time.perf_counter() - start) / (repeat * len(QUERIES)) * 1000, 3)
+    return results
+
+
+def legacy_tokenize(text):
+    """The previous BM25.tokenize"""
+    text = re.sub(r'[^\w\s]', ' ', str(text).lower())
+    return [w for w in text.split() if len(w) > 2]
+
+
+def inflect(word):
+    """Flip singular/plural the naive way a user might type it"""
+    if word.endswith("ies"):
+        return word[:-3] + "y"
+    if word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word[:-1] + "ies" if word.endswith("y") else word + "s"
+
+
+def inflected_queries(rows, column):
+    """(row index, query) pairs: a row's first keywords with the last word of each inflected"""
+    queries = []
+    for idx, row in enumerate(rows):
+        phrases = [p.strip() for p in str(row.get(column, "")).split(",") if p.strip()][:3]
+        words = [" ".join(p.split()[:-1] + [inflect(p.split()[-1].lower())]) for p in phrases]
+        if words:
+            queries.append((idx, " ".join(words)))
+    return queries
+
+
+def mean_reciprocal_rank(bm25, queries, depth=10):
+    total = 0.0
+    for idx, query in queries:
+        ranked = [doc for doc, _ in bm25.score(query, top_k=depth)]
+        total += 1 / (ranked.index(idx) + 1) if idx in ranked else 0
+    return total / len(queries) if queries else 0.0
+
+
+def fit_fields(rows, search_cols, field_weights):
+    """BM25F over one field per search column, as _build_index fits it"""
+    bm25 = BM25()
+    bm25.fit([[str(row.get(col, "")) for col in search_cols] for row in rows],
+             [(field_weights or {}).get(col, 1) for col in search_cols])
+    return bm25
+
+
+def tuning_sets():
+    """(name, search_cols, configured weights, [(rows, [query set, ...]), ...]) per domain and for the stacks"""
+    sets = []
+    for domain, config in CSV_CONFIG.items():
+        rows = _load_csv(DATA_DIR / config["file"])
+        # Keyword queries only where there is a keyword column; elsewhere they would just favor the queried column
+        queries = [inflected_queries(rows, NAME_COLUMNS[domain])]
+        if "Keywords" in config["search_cols"]:
+            queries.append(inflected_queries(rows, "Keywords"))
+        sets.append((domain, config["search_cols"], config.get("field_weights"), [(rows, queries)]))
+    stacks = []
+    for config in STACK_CONFIG.values():
+        rows = _load_csv(DATA_DIR / config["file"])
+        stacks.append((rows, [inflected_queries(rows, NAME_COLUMNS["stack"]), inflected_queries(rows, "Description")]))
+    sets.append(("stacks", _STACK_COLS["search_cols"], _STACK_COLS.get("field_weights"), stacks))
+    return sets
+
+
+def tuning_score(search_cols, field_weights, corpora):
+    """Mean MRR over every query set of every corpus"""
+    scores = [mean_reciprocal_rank(fit_fields(rows, search_cols, field_weights), queries)
+              for rows, query_sets in corpora for queries in query_sets]
+    return sum(scores) / len(scores)
+
+
+def tune_field_weights(rounds=3):
+    """
+    Coordinate search over FIELD_WEIGHT_GRID per search column, from
+    uniform weights, keeping a change only when it raises the mean MRR
+    """
+    results = []
+    for name, search_cols, configured, corpora in tuning_sets():
+        weights = {col: 1 for col in search_cols}
+        best = tuning_score(search_cols, weights, corpora)
+        for _ in range(rounds):
+            for col in search_cols:
+                for value in FIELD_WEIGHT_GRID:
+                    trial = dict(weights, **{col: value})
+                    score = tuning_score(search_cols, trial, corpora)
+                    if score > best + 1e-9:
+                        best, weights = score, trial
+        results.append({
+            "domain": name,
+            "uniform_mrr": round(tuning_score(search_cols, {}, corpora), 3),
+            "configured_mrr": round(tuning_score(search_cols, configured, corpora), 3),
+            "tuned_mrr": round(best, 3),
+            "tuned": {col: value for col, value in weights.items() if value != 1},
+        })
+    return results
+
+
+def bench_tokenizer(repeat):
+    documents = [doc for docs in csv_corpora(count=len(_index_targets())).values() for doc in docs]
+    tokenizer = BM25()
+    results = {"documents": len(documents)}
+    for name, tokenize in (("legacy", legacy_tokenize), ("current", tokenizer.tokenize)):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            tokens = sum(len(tokenize(doc)) for doc in documents)
+        elapsed = (time.perf_counter() - start) / repeat
+        results[f"{name}_ms"] = round(elapsed * 1000, 2)
+        results[f"{name}_tokens_per_s"] = round(tokens / elapsed)
+
+    start = time.perf_counter()
+    for _ in range(repeat * 100):
+        for query in QUERIES:
+            tokenizer.tokenize_query(query)
+    results["cached_query_us"] = round((time.perf_counter() - start) / (repeat * 100 * len(QUERIES)) * 1e6, 2)
+
+    relevance = []
+    for domain, config in CSV_CONFIG.items():
+        filepath = DATA_DIR / config["file"]
+        column = "Keywords" if "Keywords" in config["search_cols"] else config["search_cols"][0]
+        rows = _load_csv(filepath)
+        documents = [" ".join(str(row.get(col, "")) for col in config["search_cols"]) for row in rows]
+        queries = inflected_queries(rows, column)
+        name_queries = inflected_queries(rows, NAME_COLUMNS[domain])
+        entry = {"domain": domain, "queries": len(queries)}
+        for name, bm25 in (("legacy", BM25(stemming=False, stopwords=False)), ("current", BM25())):
+            bm25.fit(documents)
+            entry[f"{name}_mrr"] = round(mean_reciprocal_rank(bm25, queries), 3)
+            entry[f"{name}_name_mrr"] = round(mean_reciprocal_rank(bm25, name_queries), 3)
+        bm25 = fit_fields(rows, config["search_cols"], config.get("field_weights"))
+        entry["bm25f_mrr"] = round(mean_reciprocal_rank(bm25, queries), 3)
+        entry["bm25f_name_mrr"] = round(mean_reciprocal_rank(bm25, name_queries), 3)
+        relevance.append(entry)
+    results["relevance"] = relevance
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max BM25 benchmark")
+    parser.add_argument("--docs", type=int, default=100000, help="Synthetic corpus size (0 to skip)")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the query set")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--tokenizer", action="store_true", help="Compare the tokenizer with the previous one instead")
+    parser.add_argument("--tune", action="store_true", help="Search BM25F field weights against the relevance checks instead")
+    args = parser.parse_args()
+
+    if args.tune:
+        results = tune_field_weights()
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print(f"{'domain':<12} {'uniform MRR':>12} {'configured MRR':>15} {'tuned MRR':>10}  tuned weights")
+            for r in results:
+                print(f"{r['domain']:<12} {r['uniform_mrr']:>12} {r['configured_mrr']:>15} {r['tuned_mrr']:>10}  "
+                      f"{json.dumps(r['tuned'])}")
+        raise SystemExit
+
+    if args.tokenizer:
+        results = bench_tokenizer(args.repeat)
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print(f"Tokenizing {results['documents']} documents: legacy {results['legacy_ms']} ms "
+                  f"({results['legacy_tokens_per_s']} tokens/s), current {results['current_ms']} ms "
+                  f"({results['current_tokens_per_s']} tokens/s); cached query {results['cached_query_us']} us")
+            print(f"{'domain':<12} {'queries':>8} {'legacy MRR':>11} {'current MRR':>12} {'BM25F MRR':>10}  "
+                  f"{'by name: current':>17} {'BM25F':>6}")
+            for r in results["relevance"]:
+                print(f"{r['domain']:<12} {r['queries']:>8} {r['legacy_mrr']:>11} {r['current_mrr']:>12} "
+                      f"{r['bm25f_mrr']:>10}  {r['current_name_mrr']:>17} {r['bm25f_name_mrr']:>6}")
+        raise SystemExit
+
+    corpora = csv_corpora()
+    if args.docs:
+        corpora[f"synthetic-{args.docs}"] = synthetic_corpus(args.docs)
+
+    results = [bench(name, documents, args.repeat) for name, documents in corpora.items()]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'corpus':<24} {'docs':>7} {'fit ms':>9} {'scan ms/q':>10} {'postings ms/q':>14} {'speedup':>8} "
+              f"{'numpy batch ms/q':>17} {'expand ms/word':>15}")
+        for r in results:
+            print(f"{r['corpus']:<24} {r['docs']:>7} {r['fit_ms']:>9} {r['full_scan_ms']:>10} "
+                  f"{r['postings_ms']:>14} {str(r['speedup']) + 'x':>8} {str(r['batch_numpy_ms']):>17} "
+                  f"{r['expand_ms']:>15}")
@@ -5,69 +5,113 @@ UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 """
 
 import csv
+import os
 import re
+import json
+import mmap
+import heapq
+import pickle
+import struct
+import hashlib
+import threading
+import importlib.util
 from pathlib import Path
 from math import log
-from collections import defaultdict
+from functools import lru_cache
+from collections import Counter, OrderedDict, defaultdict
 
 # ============ CONFIGURATION ============
 DATA_DIR = Path(__file__).parent.parent / "data"
 MAX_RESULTS = 3
 
+# Prebuilt BM25 indexes and row stores, one per data file (see _load_index)
+INDEX_DIR = DATA_DIR / ".index"
+# Bump when the index layout or tokenization changes
+INDEX_VERSION = 6
+
+# Optional vectorized batch scoring; both are slow to import, so only on first use
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+SCIPY_AVAILABLE = NUMPY_AVAILABLE and importlib.util.find_spec("scipy") is not None
+# Batches smaller than this (docs x queries) are faster in pure Python
+VECTORIZE_MIN_WORK = 50000
+
+# Unknown query words are matched against the vocabulary (see BM25.expand):
+# at most this many terms per word, each weighted FUZZY_WEIGHT per edit
+MAX_EXPANSIONS = 3
+FUZZY_WEIGHT = 0.6
+EXPANSION_CACHE_SIZE = 4096
+
+# In-process LRU caches for long-lived callers (see invalidate)
+INDEX_CACHE_SIZE = 32
+RESULT_CACHE_SIZE = 2048
+
+# field_weights: BM25F weight per search column (1 when not listed), tuned
+# with benchmark.py --tune
 CSV_CONFIG = {
     "style": {
         "file": "styles.csv",
         "search_cols": ["Style Category", "Keywords", "Best For", "Type"],
+        "field_weights": {"Style Category": 1.5},
         "output_cols": ["Style Category", "Type", "Keywords", "Primary Colors", "Effects & Animation", "Best For", "Performance", "Accessibility", "Framework Compatibility", "Complexity"]
     },
     "prompt": {
         "file": "prompts.csv",
         "search_cols": ["Style Category", "AI Prompt Keywords (Copy-Paste Ready)", "CSS/Technical Keywords"],
+        "field_weights": {"Style Category": 1.5},
         "output_cols": ["Style Category", "AI Prompt Keywords (Copy-Paste Ready)", "CSS/Technical Keywords", "Implementation Checklist"]
     },
     "color": {
         "file": "colors.csv",
         "search_cols": ["Product Type", "Keywords", "Notes"],
+        "field_weights": {},
         "output_cols": ["Product Type", "Keywords", "Primary (Hex)", "Secondary (Hex)", "CTA (Hex)", "Background (Hex)", "Text (Hex)", "Border (Hex)", "Notes"]
     },
     "chart": {
         "file": "charts.csv",
         "search_cols": ["Data Type", "Keywords", "Best Chart Type", "Accessibility Notes"],
+        "field_weights": {},
         "output_cols": ["Data Type", "Keywords", "Best Chart Type", "Secondary Options", "Color Guidance", "Accessibility Notes", "Library Recommendation", "Interactive Level"]
     },
     "landing": {
         "file": "landing.csv",
         "search_cols": ["Pattern Name", "Keywords", "Conversion Optimization", "Section Order"],
+        "field_weights": {"Keywords": 1.5},
         "output_cols": ["Pattern Name", "Keywords", "Section Order", "Primary CTA Placement", "Color Strategy", "Conversion Optimization"]
     },
     "product": {
         "file": "products.csv",
         "search_cols": ["Product Type", "Keywords", "Primary Style Recommendation", "Key Considerations"],
+        "field_weights": {"Keywords": 2},
         "output_cols": ["Product Type", "Keywords", "Primary Style Recommendation", "Secondary Styles", "Landing Page Pattern", "Dashboard Style (if applicable)", "Color Palette Focus"]
     },
     "ux": {
         "file": "ux-guidelines.csv",
         "search_cols": ["Category", "Issue", "Description", "Platform"],
+        "field_weights": {"Issue": 2},
         "output_cols": ["Category", "Issue", "Platform", "Description", "Do", "Don't", "Code Example Good", "Code Example Bad", "Severity"]
     },
     "typography": {
         "file": "typography.csv",
         "search_cols": ["Font Pairing Name", "Category", "Mood/Style Keywords", "Best For", "Heading Font", "Body Font"],
+        "field_weights": {},
         "output_cols": ["Font Pairing Name", "Category", "Heading Font", "Body Font", "Mood/Style Keywords", "Best For", "Google Fonts URL", "CSS Import", "Tailwind Config", "Notes"]
     },
     "icons": {
         "file": "icons.csv",
         "search_cols": ["Category", "Icon Name", "Keywords", "Best For"],
+        "field_weights": {"Icon Name": 2, "Category": 0.5},
         "output_cols": ["Category", "Icon Name", "Keywords", "Library", "Import Code", "Usage", "Best For", "Style"]
     },
     "react": {
         "file": "react-performance.csv",
         "search_cols": ["Category", "Issue", "Keywords", "Description"],
+        "field_weights": {},
         "output_cols": ["Category", "Issue", "Platform", "Description", "Do", "Don't", "Code Example Good", "Code Example Bad", "Severity"]
     },
     "web": {
         "file": "web-interface.csv",
         "search_cols": ["Category", "Issue", "Keywords", "Description"],
+        "field_weights": {},
         "output_cols": ["Category", "Issue", "Platform", "Description", "Do", "Don't", "Code Example Good", "Code Example Bad", "Severity"]
     }
 }
@@ -90,105 +134,654 @@ STACK_CONFIG = {
 # Common columns for all stacks
 _STACK_COLS = {
     "search_cols": ["Category", "Guideline", "Description", "Do", "Don't"],
+    "field_weights": {"Guideline": 2, "Description": 1.5, "Category": 0.5},
     "output_cols": ["Category", "Guideline", "Description", "Do", "Don't", "Code Good", "Code Bad", "Severity", "Docs URL"]
 }
 
 AVAILABLE_STACKS = list(STACK_CONFIG.keys())
 
 
+# ============ TOKENIZER ============
+# Words of three or more characters; one pass instead of substitute + split + filter
+TOKEN_RE = re.compile(r"\w{3,}")
+
+STOPWORDS = frozenset("""
+    and are all any but can for from has have her his how into its may not our out
+    than that the their them then there these they this those too use via was were
+    what when where which who why will with you your
+""".split())
+
+
+def stem(word):
+    """Light S-stemmer (Harman): folds plural -s / -es / -ies endings only"""
+    if len(word) <= 3 or word[-1] != "s":
+        return word
+    if word.endswith("ies") and not word.endswith(("eies", "aies")):
+        return word[:-3] + "y"
+    if word.endswith(("us", "ss")):
+        return word
+    return word[:-1]
+
+
+class _StemTable(dict):
+    """word -> stem, computed on first sight; a plain dict lookup afterwards"""
+
+    MAX_SIZE = 200000
+
+    def __missing__(self, word):
+        if len(self) >= self.MAX_SIZE:
+            self.clear()
+        result = self[word] = stem(word)
+        return result
+
+
+_stems = _StemTable()
+
+
+def _tokenize(text, stemming, stopwords):
+    words = TOKEN_RE.findall(text.lower())
+    if stemming:
+        stems = _stems
+        return [stems[w] for w in words if w not in stopwords]
+    return [w for w in words if w not in stopwords] if stopwords else words
+
+
+# Queries repeat far more than documents do, so only they are cached
+_tokenize_query = lru_cache(maxsize=4096)(_tokenize)
+
+
+# ============ FUZZY MATCHING ============
+def _trigrams(term):
+    """Character trigrams of a term, with ^ and $ marking its start and end"""
+    padded = f"^{term}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _trigram_index(vocabulary):
+    """trigram -> terms containing it, for finding near matches without scanning the vocabulary"""
+    index = defaultdict(list)
+    for term in vocabulary:
+        for gram in _trigrams(term):
+            index[gram].append(term)
+    return dict(index)
+
+
+def _max_edits(term):
+    return 1 if len(term) <= 7 else 2
+
+
+def _edit_distance(a, b, limit):
+    """Optimal string alignment distance (adjacent transpositions count once), or limit + 1 if over limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous, current = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous, current = previous, current, [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], before[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+    return current[-1]
+
+
 # ============ BM25 IMPLEMENTATION ============
 class BM25:
     """BM25 ranking algorithm for text search"""
 
-    def __init__(self, k1=1.5, b=0.75):
+    def __init__(self, k1=1.5, b=0.75, stemming=True, stopwords=True):
         self.k1 = k1
         self.b = b
+        self.stemming = stemming
+        self.stopwords = STOPWORDS if stopwords else frozenset()
         self.corpus = []
         self.doc_lengths = []
         self.avgdl = 0
         self.idf = {}
         self.doc_freqs = defaultdict(int)
+        # term -> [(doc index, precomputed BM25F weight), ...] in doc order
+        self.postings = {}
+        # trigram -> vocabulary terms, for typo and prefix matching
+        self.trigrams = {}
         self.N = 0
+        # Term-document weight matrix for score_many, built on first use
+        self._matrix = None
+        # Unknown query token -> expansion, filled by expand()
+        self._expansions = {}
 
     def tokenize(self, text):
-        """Lowercase, split, remove punctuation, filter short words"""
-        text = re.sub(r'[^\w\s]', ' ', str(text).lower())
-        return [w for w in text.split() if len(w) > 2]
-
-    def fit(self, documents):
-        """Build BM25 index from documents"""
-        self.corpus = [self.tokenize(doc) for doc in documents]
+        """Lowercase, split on non-word characters, drop short words and stopwords, light-stem"""
+        return _tokenize(str(text), self.stemming, self.stopwords)
+
+    def tokenize_query(self, query):
+        """tokenize() for queries, memoized"""
+        return list(_tokenize_query(str(query), self.stemming, self.stopwords))
+
+    def fit(self, documents, field_weights=None):
+        """
+        Build BM25 index from documents
+
+        A document is a string, or a list of field strings scored BM25F
+        style: a term's frequency in each field is normalized by that
+        field's average length and scaled by the field's weight
+        (field_weights, aligned with the fields; default 1) before the
+        usual saturation. A single field of weight 1 is plain BM25.
+        Each posting stores the term's final weight for the document.
+        """
+        fields = [[doc] if isinstance(doc, str) else list(doc) for doc in documents]
+        tokenized = [[self.tokenize(field) for field in doc] for doc in fields]
+        self.corpus = [[word for field in doc for word in field] for doc in tokenized]
         self.N = len(self.corpus)
         if self.N == 0:
             return
         self.doc_lengths = [len(doc) for doc in self.corpus]
         self.avgdl = sum(self.doc_lengths) / self.N
 
-        for doc in self.corpus:
-            seen = set()
-            for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
+        field_count = max(len(doc) for doc in tokenized)
+        weights = list(field_weights or [])[:field_count]
+        weights += [1] * (field_count - len(weights))
+        avg_lengths = [sum(len(doc[i]) for doc in tokenized if i < len(doc)) / self.N or 1
+                       for i in range(field_count)]
+
+        # term -> [(doc, length-normalized, weighted term frequency)]
+        frequencies = defaultdict(list)
+        for idx, doc in enumerate(tokenized):
+            tf = {}
+            for i, field in enumerate(doc):
+                if not field or not weights[i]:
+                    continue
+                scale = weights[i] / (1 - self.b + self.b * len(field) / avg_lengths[i])
+                for word, count in Counter(field).items():
+                    tf[word] = tf.get(word, 0) + count * scale
+            for word, value in tf.items():
+                frequencies[word].append((idx, value))
+
+        saturation = self.k1 + 1
+        self.postings = {}
+        for word, docs in frequencies.items():
+            idf = log((self.N - len(docs) + 0.5) / (len(docs) + 0.5) + 1)
+            self.doc_freqs[word] = len(docs)
+            self.idf[word] = idf
+            self.postings[word] = [(idx, idf * value * saturation / (self.k1 + value)) for idx, value in docs]
+        self.trigrams = _trigram_index(self.postings)
+
+    def expand(self, token):
+        """
+        Vocabulary terms standing in for a token that is not in it: [(term, weight)]
+
+        Words the token is a prefix of, and typos within one edit (two
+        for words over seven letters); only the closest matches are kept,
+        prefixes and then the more frequent terms first, at most
+        MAX_EXPANSIONS. A typo is weighted FUZZY_WEIGHT per edit, a prefix
+        as one edit. Candidates come from the trigram index: an edit
+        changes at most three of a word's trigrams, so a term sharing
+        fewer is never compared.
+        """
+        expansions = getattr(self, "_expansions", None)
+        if expansions is None:
+            expansions = self._expansions = {}
+        if token in expansions:
+            return expansions[token]
+
+        grams = _trigrams(token)
+        shared = Counter(term for gram in grams for term in self.trigrams.get(gram, ()))
+        limit = _max_edits(token)
+        # Every trigram but the one with the end marker appears in a term the token prefixes
+        prefix_grams = len(grams) - 1
+        matches = []
+        for term, count in shared.items():
+            prefix = count >= prefix_grams and len(term) > len(token) and term.startswith(token)
+            if prefix:
+                edits = 1
+            elif count >= len(grams) - 3 * limit:
+                edits = _edit_distance(token, term, limit)
+                if edits > limit:
+                    continue
+            else:
+                continue
+            matches.append((edits, not prefix, -self.doc_freqs[term], term))
+
+        matches.sort()
+        closest = [m for m in matches if m[0] == matches[0][0]][:MAX_EXPANSIONS]
+        result = [(term, FUZZY_WEIGHT ** edits) for edits, _, _, term in closest]
+        if len(expansions) >= EXPANSION_CACHE_SIZE:
+            expansions.clear()
+        expansions[token] = result
+        return result
+
+    def query_terms(self, query):
+        """Vocabulary term -> weight for a query; unknown tokens count through expand()"""
+        terms = {}
+        for token in _tokenize_query(str(query), self.stemming, self.stopwords):
+            for term, weight in ([(token, 1)] if token in self.postings else self.expand(token)):
+                terms[term] = terms.get(term, 0) + weight
+        return terms
+
+    def score(self, query, top_k=None):
+        """
+        Score documents containing at least one query term
+
+        Returns (doc index, score) pairs, best first (ties in doc order),
+        limited to the top_k best when given. Documents matching no query
+        term score zero and are left out. Query words missing from the
+        vocabulary are matched by typo or prefix (see expand).
+        """
+        scores = {}
+
+        for term, multiplier in self.query_terms(query).items():
+            for idx, weight in self.postings[term]:
+                scores[idx] = scores.get(idx, 0) + multiplier * weight
+
+        key = lambda x: (x[1], -x[0])
+        if top_k is not None:
+            return heapq.nlargest(top_k, scores.items(), key=key)
+        return sorted(scores.items(), key=key, reverse=True)
+
+    def score_many(self, queries, top_k=None, backend=None):
+        """
+        Score a batch of queries; one score() result per query
+
+        backend is "python" (score() per query) or "numpy" (one sparse
+        matrix product over precomputed term weights, top-k by
+        argpartition). By default numpy is used when installed and the
+        batch is large enough to pay for it.
+        """
+        if backend is None:
+            backend = "numpy" if NUMPY_AVAILABLE and self.N * len(queries) >= VECTORIZE_MIN_WORK else "python"
+        if backend == "python" or self.N == 0:
+            return [self.score(query, top_k) for query in queries]
+        return self._score_many_numpy(queries, top_k)
+
+    def _weight_matrix(self):
+        """(term ids, CSR term x doc matrix of the postings' weights)"""
+        if getattr(self, "_matrix", None) is not None:
+            return self._matrix
+        import numpy as np
+
+        terms = list(self.postings)
+        lengths = np.fromiter((len(self.postings[t]) for t in terms), dtype=np.int64, count=len(terms))
+        indptr = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        docs = np.fromiter((d for t in terms for d, _ in self.postings[t]), dtype=np.int32, count=indptr[-1])
+        weights = np.fromiter((w for t in terms for _, w in self.postings[t]), dtype=np.float64, count=indptr[-1])
+
+        if SCIPY_AVAILABLE:
+            from scipy.sparse import csr_matrix
+            matrix = csr_matrix((weights, docs, indptr), shape=(len(terms), self.N))
+        else:
+            matrix = (indptr, docs, weights)
+        self._matrix = ({t: i for i, t in enumerate(terms)}, matrix)
+        return self._matrix
+
+    def _score_many_numpy(self, queries, top_k):
+        import numpy as np
+
+        term_ids, matrix = self._weight_matrix()
+        counts = [self.query_terms(q) for q in queries]
+
+        if SCIPY_AVAILABLE:
+            from scipy.sparse import csr_matrix
+            rows = [i for i, c in enumerate(counts) for _ in c]
+            cols = [term_ids[t] for c in counts for t in c]
+            vals = [n for c in counts for n in c.values()]
+            query_matrix = csr_matrix((vals, (rows, cols)), shape=(len(queries), len(term_ids)))
+            scores = (query_matrix @ matrix).toarray()
+        else:
+            # Same product without scipy: add each query term's weight column
+            indptr, docs, weights = matrix
+            scores = np.zeros((len(queries), self.N))
+            for i, c in enumerate(counts):
+                for t, n in c.items():
+                    start, end = indptr[term_ids[t]], indptr[term_ids[t] + 1]
+                    scores[i, docs[start:end]] += n * weights[start:end]
+
+        results = []
+        for row in scores:
+            candidates = np.flatnonzero(row > 0)
+            if top_k is not None and len(candidates) > top_k:
+                # Everything tied with the k-th best stays in, so ties break by doc order below
+                kth = row[candidates[np.argpartition(-row[candidates], top_k - 1)[top_k - 1]]]
+                candidates = candidates[row[candidates] >= kth]
+            order = np.lexsort((candidates, -row[candidates]))
+            if top_k is not None:
+                order = order[:top_k]
+            results.append([(int(candidates[j]), float(row[candidates[j]])) for j in order])
+        return results
+
+
+# ============ ROW STORE ============
+ROWS_MAGIC = b"UIPMROW1"
+
+
+def _encode_rows(columns, data, sha256):
+    """
+    The given columns of every row, in the row store format
+
+    Magic, a uint32 header length and a JSON header (columns, row count,
+    hash of the source CSV, cells missing from short CSV lines), then one
+    little-endian uint32 offset per cell plus an end offset, column by
+    column, then the UTF-8 cell values in the same order. Any cell is two
+    offset reads and a slice away.
+    """
+    cells = [row[col] for col in columns for row in data]
+    header = json.dumps({"columns": columns, "rows": len(data), "sha256": sha256,
+                         "missing": [i for i, value in enumerate(cells) if value is None]}).encode("utf-8")
+    values = [("" if value is None else value).encode("utf-8") for value in cells]
+    offsets = [0]
+    for value in values:
+        offsets.append(offsets[-1] + len(value))
+    return b"".join([ROWS_MAGIC, struct.pack("<I", len(header)), header,
+                     struct.pack(f"<{len(offsets)}I", *offsets)] + values)
+
+
+class RowStore:
+    """
+    Read-only rows of a row store buffer (bytes or a memory-mapped file)
+
+    rows[i] decodes that row's columns into a fresh dict on access;
+    nothing else is ever parsed, so only the rows a search returns are
+    materialized.
+    """
+
+    def __init__(self, buffer):
+        if buffer[:len(ROWS_MAGIC)] != ROWS_MAGIC:
+            raise ValueError("Not a row store")
+        start = len(ROWS_MAGIC) + 4
+        (header_length,) = struct.unpack_from("<I", buffer, len(ROWS_MAGIC))
+        header = json.loads(bytes(buffer[start:start + header_length]))
+        self.columns = header["columns"]
+        self.sha256 = header["sha256"]
+        self._count = header["rows"]
+        self._missing = frozenset(header["missing"])
+        self._offsets = start + header_length
+        self._values = self._offsets + 4 * (self._count * len(self.columns) + 1)
+        self._buffer = buffer
+
+    @classmethod
+    def open(cls, path):
+        """Memory-map a row store file"""
+        with open(path, 'rb') as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, idx):
+        if not -self._count <= idx < self._count:
+            raise IndexError("row index out of range")
+        idx %= self._count
+        row = {}
+        for position, col in enumerate(self.columns):
+            cell = position * self._count + idx
+            if cell in self._missing:
+                row[col] = None
+                continue
+            begin, end = struct.unpack_from("<2I", self._buffer, self._offsets + 4 * cell)
+            row[col] = self._buffer[self._values + begin:self._values + end].decode("utf-8")
+        return row
+
+
+# ============ PERSISTENT INDEX ============
+def _load_csv(filepath):
+    """Load CSV and return list of dicts"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
 
-        for word, freq in self.doc_freqs.items():
-            self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
 
-    def score(self, query):
-        """Score all documents against query"""
-        query_tokens = self.tokenize(query)
-        scores = []
+def _file_hash(filepath):
+    return hashlib.sha256(filepath.read_bytes()).hexdigest()
 
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
-                term_freqs[word] += 1
 
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
+def _relative(filepath):
+    return filepath.relative_to(DATA_DIR) if filepath.is_relative_to(DATA_DIR) else Path(filepath.name)
 
-            scores.append((idx, score))
 
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+def _index_path(filepath, search_cols, output_cols, field_weights=None):
+    """Index file for a data file and column configuration"""
+    relative = _relative(filepath)
+    config = json.dumps([str(relative), search_cols, output_cols, field_weights or {}, INDEX_VERSION],
+                        sort_keys=True)
+    digest = hashlib.sha1(config.encode("utf-8")).hexdigest()[:10]
+    return INDEX_DIR / f"{'__'.join(relative.with_suffix('').parts)}-{digest}.pkl"
 
 
-# ============ SEARCH FUNCTIONS ============
-def _load_csv(filepath):
-    """Load CSV and return list of dicts"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
+def _persisted_files(filepath=None):
+    """Index and row store files in INDEX_DIR, of one data file (any configuration) or of all"""
+    name = re.escape("__".join(_relative(Path(filepath)).with_suffix("").parts)) if filepath is not None else ".+"
+    pattern = re.compile(rf"{name}-[0-9a-f]{{10}}\.(pkl|rows)")
+    try:
+        return [path for path in INDEX_DIR.iterdir() if pattern.fullmatch(path.name)]
+    except OSError:
+        return []
 
 
-def _search_csv(filepath, search_cols, output_cols, query, max_results):
-    """Core search function using BM25"""
-    if not filepath.exists():
-        return []
+def _build_index(filepath, search_cols, output_cols, field_weights=None):
+    """
+    Fit BM25F over a CSV's search columns
 
+    Returns the index dict that gets persisted and the row store buffer
+    (see _encode_rows) of its output columns.
+    """
     data = _load_csv(filepath)
 
-    # Build documents from search columns
-    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
-
-    # BM25 search
+    # One field per search column
+    documents = [[str(row.get(col, "")) for col in search_cols] for row in data]
     bm25 = BM25()
-    bm25.fit(documents)
-    ranked = bm25.score(query)
+    bm25.fit(documents, [(field_weights or {}).get(col, 1) for col in search_cols])
+
+    stat = filepath.stat()
+    sha256 = _file_hash(filepath)
+    index = {
+        "version": INDEX_VERSION,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": sha256,
+        "bm25": {k: v for k, v in bm25.__dict__.items() if not k.startswith("_")},
+    }
+    # Only the columns results are built from
+    columns = [col for col in output_cols if data and col in data[0]]
+    return index, _encode_rows(columns, data, sha256)
+
+
+def _write_file(path, data):
+    """Save bytes atomically; a read-only data dir just means no persistence"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _write_index(path, index):
+    _write_file(path, pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _read_index(path):
+    try:
+        with open(path, 'rb') as f:
+            index = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    return index if isinstance(index, dict) and index.get("version") == INDEX_VERSION else None
+
+
+def _load_index(filepath, search_cols, output_cols, field_weights=None, rebuild=False):
+    """
+    Fitted BM25 and output rows (a RowStore) for a data file, from the
+    prebuilt index
+
+    The index is rebuilt when missing or when the CSV changed: a matching
+    mtime and size is trusted, otherwise the content hash decides (so a
+    fresh checkout with new mtimes does not force a rebuild). The row
+    store next to it must have been built from the same CSV content.
+    """
+    path = _index_path(filepath, search_cols, output_cols, field_weights)
+    rows_path = path.with_suffix(".rows")
+    index = None if rebuild else _read_index(path)
+
+    if index is not None:
+        stat = filepath.stat()
+        if (index["mtime_ns"], index["size"]) != (stat.st_mtime_ns, stat.st_size):
+            if index["size"] == stat.st_size and index["sha256"] == _file_hash(filepath):
+                index["mtime_ns"] = stat.st_mtime_ns
+                _write_index(path, index)
+            else:
+                index = None
+
+    rows = None
+    if index is not None:
+        try:
+            rows = RowStore.open(rows_path)
+        except (OSError, ValueError):
+            pass
+        if rows is None or rows.sha256 != index["sha256"]:
+            index = None
+
+    if index is None:
+        index, buffer = _build_index(filepath, search_cols, output_cols, field_weights)
+        # Rows first: the index file is what marks the pair as complete
+        _write_file(rows_path, buffer)
+        _write_index(path, index)
+        rows = RowStore(buffer)
+
+    bm25 = BM25.__new__(BM25)
+    bm25.__dict__.update(index["bm25"])
+    return bm25, rows
+
+
+def _index_targets():
+    """(filepath, search_cols, output_cols, field_weights) of every searchable data file"""
+    targets = [(DATA_DIR / config["file"], config["search_cols"], config["output_cols"], config.get("field_weights"))
+               for config in CSV_CONFIG.values()]
+    targets += [(DATA_DIR / config["file"], _STACK_COLS["search_cols"], _STACK_COLS["output_cols"],
+                 _STACK_COLS["field_weights"]) for config in STACK_CONFIG.values()]
+    return targets
+
+
+def build_indexes(rebuild=False):
+    """
+    Prebuild the index of every domain and stack; returns the files indexed
+
+    Index files left over from other INDEX_VERSIONs or column
+    configurations (their names no longer match) are deleted.
+    """
+    built = []
+    current = set()
+    for filepath, search_cols, output_cols, field_weights in _index_targets():
+        if filepath.exists():
+            _load_index(filepath, search_cols, output_cols, field_weights, rebuild=rebuild)
+            built.append(str(filepath.relative_to(DATA_DIR)))
+            path = _index_path(filepath, search_cols, output_cols, field_weights)
+            current.update((path, path.with_suffix(".rows")))
+    for stale in set(_persisted_files()) - current:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+    return built
+
+
+# ============ IN-PROCESS CACHE ============
+# (path, mtime_ns, size, search_cols, output_cols, field_weights) -> (bm25, rows)
+_index_cache = OrderedDict()
+# (path, mtime_ns, size, search_cols, output_cols, field_weights, normalized query, max_results) -> results
+_result_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_get(cache, key):
+    with _cache_lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _cache_put(cache, key, value, max_size):
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+
+
+def invalidate(filepath=None):
+    """
+    Drop cached indexes and results, for one data file or all of them
+
+    The persisted index files go too, so the next search rebuilds from
+    the CSV. Changed CSVs are picked up without this (cache keys include
+    mtime and size); it is for freeing memory or after editing a file in
+    place without changing its mtime and size.
+    """
+    path = str(filepath) if filepath is not None else None
+    with _cache_lock:
+        for cache in (_index_cache, _result_cache):
+            for key in [k for k in cache if path is None or k[0] == path]:
+                del cache[key]
+        for persisted in _persisted_files(filepath):
+            try:
+                persisted.unlink()
+            except OSError:
+                pass
+
+
+def _file_key(filepath, search_cols, output_cols, field_weights=None):
+    stat = filepath.stat()
+    return (str(filepath), stat.st_mtime_ns, stat.st_size, tuple(search_cols), tuple(output_cols),
+            tuple(sorted((field_weights or {}).items())))
+
+
+def _cached_index(file_key, filepath, search_cols, output_cols, field_weights=None):
+    """Fitted BM25 and rows, from memory or else the persistent index"""
+    index = _cache_get(_index_cache, file_key)
+    if index is None:
+        index = _load_index(filepath, search_cols, output_cols, field_weights)
+        _cache_put(_index_cache, file_key, index, INDEX_CACHE_SIZE)
+    return index
 
-    # Get top results with score > 0
-    results = []
-    for idx, score in ranked[:max_results]:
-        if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
 
-    return results
+# ============ SEARCH FUNCTIONS ============
+def _search_file(filepath, search_cols, output_cols, requests, field_weights=None):
+    """
+    Result lists for [(query, max_results), ...] against one data file
+
+    Repeated (normalized query, max_results) pairs are answered from the
+    result cache; the index is only loaded when something is left to score.
+    """
+    file_key = _file_key(filepath, search_cols, output_cols, field_weights)
+    found = [None] * len(requests)
+    missing = []
+    for position, (query, max_results) in enumerate(requests):
+        key = file_key + (" ".join(str(query).lower().split()), max_results)
+        found[position] = _cache_get(_result_cache, key)
+        if found[position] is None:
+            missing.append((position, query, max_results, key))
+
+    if missing:
+        bm25, rows = _cached_index(file_key, filepath, search_cols, output_cols, field_weights)
+        queries = list(dict.fromkeys(query for _, query, _, _ in missing))
+        top_k = max(max_results for _, _, max_results, _ in missing)
+        ranked = dict(zip(queries, bm25.score_many(queries, top_k=top_k)))
+        for position, query, max_results, key in missing:
+            # Get top results with score > 0
+            found[position] = [rows[idx] for idx, score in ranked[query][:max_results] if score > 0]
+            _cache_put(_result_cache, key, found[position], RESULT_CACHE_SIZE)
+
+    # Copies, so callers cannot alter what is cached
+    return [[dict(row) for row in results] for results in found]
+
+
+def _search_csv(filepath, search_cols, output_cols, query, max_results, field_weights=None):
+    """Core search function using BM25"""
+    if not filepath.exists():
+        return []
+    return _search_file(filepath, search_cols, output_cols, [(query, max_results)], field_weights)[0]
 
 
 def detect_domain(query):
@@ -216,24 +809,48 @@ def detect_domain(query):
 
 def search(query, domain=None, max_results=MAX_RESULTS):
     """Main search function with auto-domain detection"""
-    if domain is None:
-        domain = detect_domain(query)
-
-    config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
-    filepath = DATA_DIR / config["file"]
-
-    if not filepath.exists():
-        return {"error": f"File not found: {filepath}", "domain": domain}
-
-    results = _search_csv(filepath, config["search_cols"], config["output_cols"], query, max_results)
-
-    return {
-        "domain": domain,
-        "query": query,
-        "file": config["file"],
-        "count": len(results),
-        "results": results
-    }
+    return search_many([(query, domain, max_results)])[0]
+
+
+def search_many(requests):
+    """
+    Run several searches at once: [(query, domain, max_results), ...]
+
+    Each data file's index is loaded once and each distinct query is
+    tokenized and scored once per file, however many requests share them;
+    repeats of earlier searches come from the in-process result cache.
+    A domain of None is auto-detected. Returns one search() result per
+    request, in request order.
+    """
+    responses = [None] * len(requests)
+    by_file = defaultdict(list)
+    for position, (query, domain, max_results) in enumerate(requests):
+        if domain is None:
+            domain = detect_domain(query)
+        config = CSV_CONFIG.get(domain, CSV_CONFIG["style"])
+        by_file[config["file"]].append((position, query, domain, max_results))
+
+    for file, items in by_file.items():
+        config = next(c for c in CSV_CONFIG.values() if c["file"] == file)
+        filepath = DATA_DIR / file
+        if not filepath.exists():
+            for position, _, domain, _ in items:
+                responses[position] = {"error": f"File not found: {filepath}", "domain": domain}
+            continue
+
+        found = _search_file(filepath, config["search_cols"], config["output_cols"],
+                             [(query, max_results) for _, query, _, max_results in items],
+                             config.get("field_weights"))
+        for (position, query, domain, max_results), results in zip(items, found):
+            responses[position] = {
+                "domain": domain,
+                "query": query,
+                "file": file,
+                "count": len(results),
+                "results": results
+            }
+
+    return responses
 
 
 def search_stack(query, stack, max_results=MAX_RESULTS):
@@ -246,7 +863,8 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
     if not filepath.exists():
         return {"error": f"Stack file not found: {filepath}", "stack": stack}
 
-    results = _search_csv(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results)
+    results = _search_csv(filepath, _STACK_COLS["search_cols"], _STACK_COLS["output_cols"], query, max_results,
+                          _STACK_COLS["field_weights"])
 
     return {
         "domain": "stack",
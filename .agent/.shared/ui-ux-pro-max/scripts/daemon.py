@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Daemon - resident search server for search.py
+Usage: python search.py --serve [--socket PATH]
+       python search.py --stop
+
+Keeps every index loaded and answers newline-delimited JSON requests over a
+Unix socket in a private per-user directory (localhost TCP where Unix
+sockets are unavailable); sockets owned by another user are ignored. search.py
+sends its query here when a daemon is running and searches in-process
+otherwise.
+
+Request:  {"op": "search", "query": "...", "domain": null, "max_results": 3}
+          {"op": "stack", "query": "...", "stack": "react", "max_results": 3}
+          {"op": "search_many", "requests": [["query", "style", 3], ...]}
+          {"op": "design_system", "query": "...", "project_name": null, "format": "ascii"}
+          {"op": "ping"} / {"op": "shutdown"}
+Response: {"ok": true, "result": ...} or {"ok": false, "error": "..."}
+"""
+
+import os
+import sys
+import json
+import stat
+import socket
+import hashlib
+import tempfile
+import threading
+import socketserver
+from pathlib import Path
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+DEFAULT_PORT = 47319
+# How long a client waits for a daemon to accept before searching in-process
+CONNECT_TIMEOUT = 0.2
+REQUEST_TIMEOUT = 30
+
+
+def _socket_dir():
+    """
+    A directory only this user can enter: $XDG_RUNTIME_DIR, or a 0700
+    ui-ux-pro-max-<uid> directory in the temp dir
+
+    Raises OSError when the temp dir one exists but is not a private
+    directory of this user (someone else created it first).
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return runtime_dir
+    path = os.path.join(tempfile.gettempdir(), f"ui-ux-pro-max-{os.getuid()}")
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise OSError(f"Refusing to use {path}: not a private directory of this user")
+    return path
+
+
+def default_address():
+    """
+    ("unix", path) or ("tcp", (host, port)); overridable via UI_PRO_MAX_SOCKET / UI_PRO_MAX_PORT
+
+    Raises OSError when no private socket directory is available.
+    """
+    if hasattr(socket, "AF_UNIX") and hasattr(os, "getuid") and not os.environ.get("UI_PRO_MAX_PORT"):
+        path = os.environ.get("UI_PRO_MAX_SOCKET")
+        if not path:
+            # One daemon per user and data directory; kept short for the socket path limit
+            tag = hashlib.sha1(str(DATA_DIR.resolve()).encode("utf-8")).hexdigest()[:8]
+            path = os.path.join(_socket_dir(), f"ui-ux-pro-max-{tag}.sock")
+        return ("unix", path)
+    return ("tcp", ("127.0.0.1", int(os.environ.get("UI_PRO_MAX_PORT", DEFAULT_PORT))))
+
+
+def _connect(address, timeout):
+    kind, target = address
+    # Another user's socket would hand us their "results"
+    if kind == "unix" and os.stat(target).st_uid != os.getuid():
+        raise PermissionError(f"{target} is owned by another user")
+    sock = socket.socket(socket.AF_UNIX if kind == "unix" else socket.AF_INET, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(target)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def request(payload, address=None):
+    """
+    Send one request to a running daemon
+
+    Returns the decoded response, or None when no daemon answers or its
+    socket is not this user's (the caller then searches in-process).
+    """
+    try:
+        address = address or default_address()
+        sock = _connect(address, CONNECT_TIMEOUT)
+    except OSError:
+        return None
+    try:
+        with sock, sock.makefile("rwb") as stream:
+            sock.settimeout(REQUEST_TIMEOUT)
+            stream.write(json.dumps(payload).encode("utf-8") + b"\n")
+            stream.flush()
+            line = stream.readline()
+    except OSError:
+        return None
+    return json.loads(line) if line else None
+
+
+def handle(payload):
+    """Answer one request with the in-process search functions"""
+    import core
+
+    op = payload.get("op")
+    if op == "ping":
+        return {"pid": os.getpid()}
+    if op == "search":
+        return core.search(payload["query"], payload.get("domain"), payload.get("max_results", core.MAX_RESULTS))
+    if op == "stack":
+        return core.search_stack(payload["query"], payload["stack"], payload.get("max_results", core.MAX_RESULTS))
+    if op == "search_many":
+        return core.search_many([tuple(r) for r in payload["requests"]])
+    if op == "design_system":
+        from design_system import generate_design_system
+        return generate_design_system(payload["query"], payload.get("project_name"), payload.get("format", "ascii"))
+    raise ValueError(f"Unknown op: {op}")
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            shutdown = False
+            try:
+                payload = json.loads(line)
+                if payload.get("op") == "shutdown":
+                    shutdown = True
+                    response = {"ok": True, "result": None}
+                else:
+                    response = {"ok": True, "result": handle(payload)}
+            except Exception as e:
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+            if shutdown:
+                # Only once the client has its answer; shutdown() blocks, so not on this thread
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+def _preload():
+    """Load every index into the in-process cache so the first queries are fast"""
+    import core
+
+    for filepath, search_cols, output_cols, field_weights in core._index_targets():
+        if filepath.exists():
+            core._cached_index(core._file_key(filepath, search_cols, output_cols, field_weights),
+                               filepath, search_cols, output_cols, field_weights)
+
+
+def serve(address=None, quiet=False):
+    """Run the daemon until interrupted or sent {"op": "shutdown"}"""
+    address = address or default_address()
+    kind, target = address
+
+    if request({"op": "ping"}, address) is not None:
+        sys.exit(f"A search daemon is already listening on {target}")
+
+    _preload()
+    if kind == "unix":
+        if os.path.exists(target):
+            os.unlink(target)  # Left behind by a daemon that did not exit cleanly
+        server = socketserver.ThreadingUnixStreamServer(target, _RequestHandler)
+        os.chmod(target, 0o600)
+    else:
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        server = socketserver.ThreadingTCPServer(target, _RequestHandler)
+    server.daemon_threads = True
+
+    if not quiet:
+        print(f"UI Pro Max search daemon listening on {target} (pid {os.getpid()})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if kind == "unix" and os.path.exists(target):
+            os.unlink(target)
@@ -18,7 +18,7 @@ import json
 import os
 from datetime import datetime
 from pathlib import Path
-from core import search, DATA_DIR
+from core import search_many, DATA_DIR
 
 
 # ============ CONFIGURATION ============
@@ -48,17 +48,23 @@ class DesignSystemGenerator:
         with open(filepath, 'r', encoding='utf-8') as f:
             return list(csv.DictReader(f))
 
-    def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
-        """Execute searches across multiple domains."""
-        results = {}
-        for domain, config in SEARCH_CONFIG.items():
+    def _multi_domain_search(self, query: str, style_priority: list = None, results: dict = None,
+                             domains: list = None) -> dict:
+        """Execute searches across multiple domains in one batch, reusing domains already in results."""
+        results = dict(results or {})
+        requests = []
+        for domain in domains or SEARCH_CONFIG:
+            config = SEARCH_CONFIG[domain]
+            if domain in results:
+                continue
             if domain == "style" and style_priority:
                 # For style, also search with priority keywords
                 priority_query = " ".join(style_priority[:2]) if style_priority else query
-                combined_query = f"{query} {priority_query}"
-                results[domain] = search(combined_query, domain, config["max_results"])
+                requests.append((f"{query} {priority_query}", domain, config["max_results"]))
             else:
-                results[domain] = search(query, domain, config["max_results"])
+                requests.append((query, domain, config["max_results"]))
+        for (_, domain, _), result in zip(requests, search_many(requests)):
+            results[domain] = result
         return results
 
     def _find_reasoning_rule(self, category: str) -> dict:
@@ -162,8 +168,9 @@ class DesignSystemGenerator:
 
     def generate(self, query: str, project_name: str = None) -> dict:
         """Generate complete design system recommendation."""
-        # Step 1: First search product to get category
-        product_result = search(query, "product", 1)
+        # Step 1: Search every domain that does not depend on the product category
+        search_results = self._multi_domain_search(query, domains=[d for d in SEARCH_CONFIG if d != "style"])
+        product_result = search_results["product"]
         product_results = product_result.get("results", [])
         category = "General"
         if product_results:
@@ -173,9 +180,8 @@ class DesignSystemGenerator:
         reasoning = self._apply_reasoning(category, {})
         style_priority = reasoning.get("style_priority", [])
 
-        # Step 3: Multi-domain search with style priority hints
-        search_results = self._multi_domain_search(query, style_priority)
-        search_results["product"] = product_result  # Reuse product search
+        # Step 3: Style search with priority hints, reusing the other domains
+        search_results = self._multi_domain_search(query, style_priority, search_results)
 
         # Step 4: Select best matches from each domain using priority
         style_results = self._extract_results(search_results.get("style", {}))
@@ -918,16 +924,16 @@ def _generate_intelligent_overrides(page_name: str, page_query: str, design_syst
     Uses the existing search infrastructure to find relevant style, UX, and layout
     data instead of hardcoded page types.
     """
-    from core import search
-    
     page_lower = page_name.lower()
     query_lower = (page_query or "").lower()
     combined_context = f"{page_lower} {query_lower}"
     
     # Search across multiple domains for page-specific guidance
-    style_search = search(combined_context, "style", max_results=1)
-    ux_search = search(combined_context, "ux", max_results=3)
-    landing_search = search(combined_context, "landing", max_results=1)
+    style_search, ux_search, landing_search = search_many([
+        (combined_context, "style", 1),
+        (combined_context, "ux", 3),
+        (combined_context, "landing", 1),
+    ])
     
     # Extract results from search response
     style_results = style_search.get("results", [])
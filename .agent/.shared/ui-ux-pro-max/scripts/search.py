@@ -3,20 +3,39 @@
 """
 UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
 Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
+       python search.py --build-index
+       python search.py --serve | --stop
        python search.py "<query>" --design-system [-p "Project Name"]
        python search.py "<query>" --design-system --persist [-p "Project Name"] [--page "dashboard"]
 
 Domains: style, prompt, color, chart, landing, product, ux, typography
 Stacks: html-tailwind, react, nextjs
 
+Indexes: searches read prebuilt BM25 indexes and binary row stores (only the
+output columns, decoded per returned row) from data/.index, rebuilt
+automatically when a CSV changes. --build-index rebuilds them all up front.
+
+Daemon: --serve keeps every index resident and answers over a local socket
+(see daemon.py); while it runs, searches are sent to it automatically.
+--no-daemon forces an in-process search.
+
 Persistence (Master + Overrides pattern):
   --persist    Save design system to design-system/MASTER.md
   --page       Also create a page-specific override file in design-system/pages/
 """
 
 import argparse
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
-from design_system import generate_design_system, persist_design_system
+import daemon
+from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack, build_indexes
+
+
+def run(payload, local, use_daemon=True):
+    """Answer via the search daemon when one is running, else in-process"""
+    if use_daemon:
+        response = daemon.request(payload)
+        if response is not None and response.get("ok"):
+            return response["result"]
+    return local()
 
 
 def format_output(result):
@@ -47,7 +66,7 @@ def format_output(result):
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
+    parser.add_argument("query", nargs="?", help="Search query")
     parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
     parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
     parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
@@ -60,19 +79,41 @@ if __name__ == "__main__":
     parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
     parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
     parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
+    # Index maintenance
+    parser.add_argument("--build-index", action="store_true", help="Rebuild the search indexes in data/.index and exit")
+    # Resident daemon
+    parser.add_argument("--serve", action="store_true", help="Run the search daemon (keeps indexes resident)")
+    parser.add_argument("--stop", action="store_true", help="Stop a running search daemon")
+    parser.add_argument("--no-daemon", action="store_true", help="Search in-process even if a daemon is running")
 
     args = parser.parse_args()
+    use_daemon = not args.no_daemon
 
+    if args.build_index:
+        built = build_indexes(rebuild=True)
+        print(f"Built {len(built)} indexes: {', '.join(built)}")
+    elif args.serve:
+        daemon.serve()
+    elif args.stop:
+        print("Search daemon stopped" if daemon.request({"op": "shutdown"}) else "No search daemon running")
+    elif args.query is None:
+        parser.error("the following arguments are required: query")
     # Design system takes priority
-    if args.design_system:
-        result = generate_design_system(
-            args.query, 
-            args.project_name, 
-            args.format,
-            persist=args.persist,
-            page=args.page,
-            output_dir=args.output_dir
-        )
+    elif args.design_system:
+        def generate_locally():
+            from design_system import generate_design_system
+            return generate_design_system(
+                args.query,
+                args.project_name,
+                args.format,
+                persist=args.persist,
+                page=args.page,
+                output_dir=args.output_dir
+            )
+
+        # Persisting writes files relative to this process, so it never goes to the daemon
+        payload = {"op": "design_system", "query": args.query, "project_name": args.project_name, "format": args.format}
+        result = run(payload, generate_locally, use_daemon and not args.persist)
         print(result)
         
         # Print persistence confirmation
@@ -90,7 +131,8 @@ if __name__ == "__main__":
             print("=" * 60)
     # Stack search
     elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
+        payload = {"op": "stack", "query": args.query, "stack": args.stack, "max_results": args.max_results}
+        result = run(payload, lambda: search_stack(args.query, args.stack, args.max_results), use_daemon)
         if args.json:
             import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
@@ -98,7 +140,8 @@ if __name__ == "__main__":
             print(format_output(result))
     # Domain search
     else:
-        result = search(args.query, args.domain, args.max_results)
+        payload = {"op": "search", "query": args.query, "domain": args.domain, "max_results": args.max_results}
+        result = run(payload, lambda: search(args.query, args.domain, args.max_results), use_daemon)
         if args.json:
             import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
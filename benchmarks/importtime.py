@@ -0,0 +1,124 @@
+"""
+Cold-start import benchmark for the Netlify Python functions.
+
+Runs each scenario in a fresh interpreter under `python -X importtime` and
+reports the import time it adds on top of a bare interpreter start.
+
+Usage:
+    python benchmarks/importtime.py [--runs 5] [--json] [--max-ms 50]
+
+Scenarios per handler:
+    import      `import index`
+    validation  a request rejected with 400 (no client import expected)
+    client      `import fotmob`, the cost every 200 response pays
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+FUNCTIONS_DIR = os.path.join(ROOT, 'netlify', 'functions')
+HANDLERS = ['match_details', 'standings']
+
+SCENARIOS = {
+    'import': "import index",
+    'validation': "import index; index.handler({'queryStringParameters': {}}, None)",
+    'client': "import fotmob",
+}
+
+# Modules whose presence on the validation path means the lazy import broke
+HEAVY_MODULES = ('fotmob', 'aiohttp', 'asyncio')
+
+
+def run_importtime(code, cwd):
+    """
+    Return ({top-level module: cumulative us}, every imported module name)
+    for one interpreter run, or None on failure.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=cwd, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None
+
+    modules = {}
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        imported.add(name.strip())
+        # Nested imports are indented; only top-level entries add up
+        if name[1:].startswith(' '):
+            continue
+        modules[name.strip()] = int(cumulative)
+    return modules, imported
+
+
+def measure(code, cwd, runs):
+    """Median added import time (ms) and the heaviest imports of the last run"""
+    baseline, _ = run_importtime('pass', cwd) or ({}, set())
+    totals = []
+    for _ in range(runs):
+        run = run_importtime(code, cwd)
+        if run is None:
+            return None
+        modules, imported = run
+        added = {name: us for name, us in modules.items() if name not in baseline}
+        totals.append(sum(added.values()) / 1000)
+    return {
+        'ms': round(statistics.median(totals), 2),
+        'heavy': sorted(m for m in HEAVY_MODULES if m in imported),
+        'top': sorted(((name, round(us / 1000, 2)) for name, us in modules.items() if name not in baseline),
+                      key=lambda item: item[1], reverse=True)[:5],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time benchmark for the Netlify functions")
+    parser.add_argument('--runs', type=int, default=5, help="Runs per scenario (median is reported)")
+    parser.add_argument('--json', action='store_true', help="Output as JSON")
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help="Fail if a handler's import or validation path exceeds this many ms")
+    args = parser.parse_args()
+
+    report = {}
+    for name in HANDLERS:
+        cwd = os.path.join(FUNCTIONS_DIR, name)
+        report[name] = {scenario: measure(code, cwd, args.runs) for scenario, code in SCENARIOS.items()}
+
+    failed = []
+    for name, scenarios in report.items():
+        for scenario in ('import', 'validation'):
+            result = scenarios[scenario]
+            if result is None:
+                failed.append(f"{name}/{scenario}: run failed")
+            elif result['heavy']:
+                failed.append(f"{name}/{scenario}: imported {', '.join(result['heavy'])}")
+            elif args.max_ms is not None and result['ms'] > args.max_ms:
+                failed.append(f"{name}/{scenario}: {result['ms']} ms > {args.max_ms} ms")
+
+    if args.json:
+        print(json.dumps({'results': report, 'failures': failed}, indent=2))
+    else:
+        for name, scenarios in report.items():
+            print(f"## {name}")
+            for scenario, result in scenarios.items():
+                if result is None:
+                    print(f"  {scenario:<11} n/a (import failed)")
+                    continue
+                top = ', '.join(f"{module} {ms}" for module, ms in result['top'])
+                print(f"  {scenario:<11} {result['ms']:>8.2f} ms   [{top}]")
+        for failure in failed:
+            print(f"FAIL {failure}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Load generator for the Netlify functions served by netlify/dev/server.py.
+
+Fires requests from a pool of worker threads and reports latency
+percentiles, throughput, status codes and, when the server runs the
+FotMob stub, how many upstream calls and sessions the run caused.
+
+Usage:
+    python netlify/dev/server.py --quiet &
+    python benchmarks/loadtest.py [-n 500] [-c 20] [--path "/.netlify/functions/standings?id=47" ...]
+"""
+
+import sys
+import json
+import time
+import argparse
+import statistics
+import urllib.request
+import urllib.error
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_PATHS = [
+    '/.netlify/functions/match_details?id=fm-4837348',
+    '/.netlify/functions/match_details?ids=4837348,4830650,4803283',
+    '/.netlify/functions/standings?id=47',
+]
+
+
+def fetch(url, timeout):
+    """Return (status, seconds) for one GET"""
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except Exception:
+        status = 'error'
+    return status, time.perf_counter() - start
+
+
+def get_stats(base_url, reset=False):
+    try:
+        with urllib.request.urlopen(f"{base_url}/__stats{'?reset=1' if reset else ''}", timeout=5) as response:
+            return json.loads(response.read())
+    except Exception:
+        return None
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run(base_url, paths, requests, concurrency, timeout):
+    urls = [base_url + paths[i % len(paths)] for i in range(requests)]
+    get_stats(base_url, reset=True)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda url: fetch(url, timeout), urls))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(seconds * 1000 for _, seconds in results)
+    return {
+        'requests': requests,
+        'concurrency': concurrency,
+        'elapsed_s': round(elapsed, 3),
+        'rps': round(requests / elapsed, 1) if elapsed else 0.0,
+        'status': dict(Counter(str(status) for status, _ in results)),
+        'latency_ms': {
+            'mean': round(statistics.mean(latencies), 2) if latencies else 0.0,
+            'p50': round(percentile(latencies, 50), 2),
+            'p95': round(percentile(latencies, 95), 2),
+            'p99': round(percentile(latencies, 99), 2),
+            'max': round(latencies[-1], 2) if latencies else 0.0,
+        },
+        'upstream': get_stats(base_url),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the local Netlify functions")
+    parser.add_argument('--base-url', default='http://127.0.0.1:8888')
+    parser.add_argument('--path', action='append', dest='paths', help="Request path (repeatable); cycles through all")
+    parser.add_argument('-n', '--requests', type=int, default=200)
+    parser.add_argument('-c', '--concurrency', type=int, default=10)
+    parser.add_argument('--timeout', type=float, default=30)
+    parser.add_argument('--json', action='store_true', help="Output as JSON")
+    args = parser.parse_args()
+
+    report = run(args.base_url.rstrip('/'), args.paths or DEFAULT_PATHS, args.requests, args.concurrency, args.timeout)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    latency = report['latency_ms']
+    print(f"{report['requests']} requests, concurrency {report['concurrency']}: "
+          f"{report['elapsed_s']} s, {report['rps']} req/s")
+    print(f"latency ms  p50 {latency['p50']}  p95 {latency['p95']}  p99 {latency['p99']}  "
+          f"mean {latency['mean']}  max {latency['max']}")
+    print(f"status      {report['status']}")
+    upstream = report['upstream']
+    if upstream and 'total' in upstream:
+        print(f"upstream    {upstream['total']} calls over {upstream['sessions']} sessions "
+              f"({upstream['total'] / report['requests']:.2f}/request)  {upstream['calls']}")
+
+    if any(status.startswith('5') or status == 'error' for status in report['status']):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""
+Parser backend benchmark for SoccerwayScraper on saved pages.
+
+For every BeautifulSoup backend, with and without the match-row
+restricted parse, runs parse_page() + parse_matches() over the pages and
+reports pages/sec, rows/sec and peak traced memory per page.
+
+Usage:
+    python benchmarks/soccerway_parsers.py --save https://www.soccerway.com/match/?date=2026-02-14
+    python benchmarks/soccerway_parsers.py [pages ...] [--repeat 5]
+
+Pages default to benchmarks/pages/*.html (--save downloads URLs there),
+or to the checked-in benchmarks/fixtures/soccerway/*.html when none are
+saved. The fixtures are synthetic pages in soccerway's layout (header,
+navigation, scripts, sidebar, match tables and match-row blocks), kept
+small so the benchmark runs offline.
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import tracemalloc
+from urllib.parse import urlparse
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from soccerway_scraper import SoccerwayScraper, PARSER_BACKENDS  # noqa: E402
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pages')
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'soccerway')
+
+
+def save_pages(urls):
+    os.makedirs(PAGES_DIR, exist_ok=True)
+    scraper = SoccerwayScraper()
+    try:
+        for url in urls:
+            response = scraper.session.get(url, timeout=scraper.timeout)
+            response.raise_for_status()
+            parsed = urlparse(url)
+            name = (parsed.path.strip('/').replace('/', '_') or 'home') + (f"_{parsed.query}" if parsed.query else '')
+            path = os.path.join(PAGES_DIR, ''.join(c if c.isalnum() or c in '-_.' else '_' for c in name) + '.html')
+            with open(path, 'wb') as f:
+                f.write(response.content)
+            print(f"Saved {path}")
+    finally:
+        scraper.close()
+
+
+def bench(bodies, parser, restrict, repeat):
+    scraper = SoccerwayScraper(parser=parser, restrict=restrict)
+    scraper.close()
+
+    rows = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for body in bodies:
+            rows += len(scraper.parse_matches(scraper.parse_page(body, matches_only=True)))
+    elapsed = time.perf_counter() - start
+
+    # Memory is traced separately so tracing overhead does not skew timings
+    peak = 0
+    for body in bodies:
+        tracemalloc.start()
+        scraper.parse_matches(scraper.parse_page(body, matches_only=True))
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    pages = len(bodies) * repeat
+    return {
+        'parser': parser,
+        'restrict': scraper.restrict,
+        'pages_per_s': round(pages / elapsed, 1),
+        'rows_per_s': round(rows / elapsed, 1),
+        'rows_per_page': round(rows / pages, 1),
+        'peak_mib_per_page': round(peak / 2 ** 20, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SoccerwayScraper parser backends")
+    parser.add_argument('pages', nargs='*', help="Saved HTML pages (default: benchmarks/pages/*.html, "
+                                                  "else benchmarks/fixtures/soccerway/*.html)")
+    parser.add_argument('--repeat', type=int, default=5, help="Passes over the page set")
+    parser.add_argument('--save', nargs='+', metavar='URL', help="Download pages into benchmarks/pages and exit")
+    parser.add_argument('--json', action='store_true', help="Output as JSON")
+    args = parser.parse_args()
+
+    if args.save:
+        save_pages(args.save)
+        return
+
+    paths = (args.pages or sorted(glob.glob(os.path.join(PAGES_DIR, '*.html')))
+             or sorted(glob.glob(os.path.join(FIXTURES_DIR, '*.html'))))
+    if not paths:
+        sys.exit("No pages to parse. Save some first with --save <url> ...")
+    bodies = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            bodies.append(f.read())
+
+    results = []
+    for backend in PARSER_BACKENDS:
+        for restrict in (False, True):
+            if restrict and backend == 'html5lib':
+                continue
+            try:
+                results.append(bench(bodies, backend, restrict, args.repeat))
+            except Exception as e:
+                # Backend not installed (bs4.FeatureNotFound) or similar
+                print(f"Skipping {backend}: {e}", file=sys.stderr)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{len(bodies)} pages x {args.repeat} passes")
+    print(f"{'parser':<12} {'restrict':<9} {'pages/s':>9} {'rows/s':>10} {'rows/page':>10} {'peak MiB':>9}")
+    for r in results:
+        print(f"{r['parser']:<12} {str(r['restrict']):<9} {r['pages_per_s']:>9} {r['rows_per_s']:>10} "
+              f"{r['rows_per_page']:>10} {r['peak_mib_per_page']:>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Record live FotMob responses as fixtures for the dev server's stub.
+
+Usage:
+    python netlify/dev/record_fixtures.py --match 4837348 --league 47 87
+
+Writes netlify/dev/fixtures/<endpoint>/<id>.json for every id given.
+"""
+
+import os
+import json
+import asyncio
+import argparse
+
+from fotmob import FotMob
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def save(endpoint, key, data):
+    os.makedirs(os.path.join(FIXTURES_DIR, endpoint), exist_ok=True)
+    path = os.path.join(FIXTURES_DIR, endpoint, f"{key}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    print(f"Saved {path}")
+
+
+async def record(match_ids, league_ids):
+    async with FotMob(proxy_url="") as fotmob:
+        for match_id in match_ids:
+            save('match_details', match_id, await fotmob.get_match_details(match_id))
+            save('match_comments', match_id, await fotmob.get_match_comments(match_id))
+            save('match_odds', match_id, await fotmob.get_match_odds(match_id))
+            save('tv_listings', match_id, await fotmob.get_tv_listings(match_id, "US"))
+        for league_id in league_ids:
+            save('standings', league_id, await fotmob.standings(league_id))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record FotMob fixtures for the dev server")
+    parser.add_argument('--match', type=int, nargs='*', default=[], help="Match ids to record")
+    parser.add_argument('--league', type=int, nargs='*', default=[], help="League ids to record standings for")
+    args = parser.parse_args()
+    asyncio.run(record(args.match, args.league))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+Local runner for the Netlify Python functions.
+
+Serves every handler in netlify/functions at /.netlify/functions/<name>,
+backed by the recorded-fixture FotMob stub in netlify/dev/stub unless
+--live is given.
+
+Usage:
+    python netlify/dev/server.py [--port 8888] [--latency 0.15] [--jitter 0.05] [--live]
+
+Extra endpoints:
+    GET /__stats          upstream (stub) call counts
+    GET /__stats?reset=1  same, then reset the counters
+"""
+
+import os
+import sys
+import json
+import argparse
+import importlib.util
+from urllib.parse import urlparse, parse_qsl
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEV_DIR = os.path.dirname(os.path.abspath(__file__))
+FUNCTIONS_DIR = os.path.join(DEV_DIR, '..', 'functions')
+STUB_DIR = os.path.join(DEV_DIR, 'stub')
+PREFIX = '/.netlify/functions/'
+
+
+def load_handlers():
+    """{function name: handler} for every netlify/functions/<name>/index.py"""
+    handlers = {}
+    for name in sorted(os.listdir(FUNCTIONS_DIR)):
+        path = os.path.join(FUNCTIONS_DIR, name, 'index.py')
+        if not os.path.exists(path):
+            continue
+        # As on Netlify, a function's own directory is importable from it
+        function_dir = os.path.abspath(os.path.join(FUNCTIONS_DIR, name))
+        if function_dir not in sys.path:
+            sys.path.append(function_dir)
+        spec = importlib.util.spec_from_file_location(f"{name}_function", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        handlers[name] = module.handler
+    return handlers
+
+
+def make_request_handler(handlers, stub):
+    class FunctionRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = dict(parse_qsl(url.query))
+
+            if url.path == '/__stats':
+                body = stub.stats() if stub else {}
+                if stub and params.get('reset'):
+                    stub.reset()
+                return self._send(200, {'Content-Type': 'application/json'}, json.dumps(body))
+
+            name = url.path[len(PREFIX):].strip('/') if url.path.startswith(PREFIX) else None
+            if name not in handlers:
+                return self._send(404, {'Content-Type': 'application/json'},
+                                  json.dumps({'error': f'No function at {url.path}'}))
+
+            event = {
+                'httpMethod': 'GET',
+                'path': url.path,
+                'headers': dict(self.headers),
+                'queryStringParameters': params,
+            }
+            response = handlers[name](event, {})
+            self._send(response.get('statusCode', 200), response.get('headers', {}), response.get('body', ''))
+
+        def _send(self, status, headers, body):
+            payload = body.encode('utf-8') if isinstance(body, str) else body
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            if not self.server.quiet:
+                super().log_message(format, *args)
+
+    return FunctionRequestHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the Netlify Python functions locally")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8888)
+    parser.add_argument('--latency', type=float, default=0.15, help="Stub upstream latency per call (seconds)")
+    parser.add_argument('--jitter', type=float, default=0.05, help="Extra random latency per call (seconds)")
+    parser.add_argument('--live', action='store_true', help="Use the real fotmob package instead of the stub")
+    parser.add_argument('--quiet', action='store_true', help="Do not log each request")
+    args = parser.parse_args()
+
+    stub = None
+    if not args.live:
+        sys.path.insert(0, STUB_DIR)
+        import fotmob as stub
+        stub.LATENCY = args.latency
+        stub.JITTER = args.jitter
+
+    handlers = load_handlers()
+    server = ThreadingHTTPServer((args.host, args.port), make_request_handler(handlers, stub))
+    server.quiet = args.quiet
+    print(f"Serving {', '.join(handlers)} at http://{args.host}:{args.port}{PREFIX}<name>"
+          f" ({'live FotMob' if args.live else f'stub, {args.latency}s latency'})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
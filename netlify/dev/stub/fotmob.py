@@ -0,0 +1,84 @@
+"""
+Recorded-fixture stand-in for the fotmob-wrapper package.
+
+netlify/dev/server.py puts this directory first on sys.path, so the
+functions' `from fotmob import FotMob` resolves here. Responses come from
+netlify/dev/fixtures/<endpoint>/<id>.json, falling back to
+netlify/dev/fixtures/<endpoint>.json, after a configurable delay.
+"""
+
+import os
+import json
+import random
+import asyncio
+import threading
+from collections import Counter
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), '..', 'fixtures')
+
+# Simulated upstream latency, set by the dev server
+LATENCY = 0.0
+JITTER = 0.0
+
+CALLS = Counter()
+SESSIONS = Counter()
+_lock = threading.Lock()
+
+
+def stats():
+    with _lock:
+        return {'sessions': sum(SESSIONS.values()), 'calls': dict(CALLS), 'total': sum(CALLS.values())}
+
+
+def reset():
+    with _lock:
+        CALLS.clear()
+        SESSIONS.clear()
+
+
+def load_fixture(endpoint, key=None):
+    candidates = []
+    if key is not None:
+        candidates.append(os.path.join(FIXTURES_DIR, endpoint, f"{key}.json"))
+    candidates.append(os.path.join(FIXTURES_DIR, f"{endpoint}.json"))
+    for path in candidates:
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    raise Exception(f"API request to /{endpoint} failed: no fixture for {key}")
+
+
+class FotMob:
+    def __init__(self, proxy_url=None):
+        self.proxy_url = proxy_url
+
+    async def __aenter__(self):
+        with _lock:
+            SESSIONS['open'] += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def _get(self, endpoint, key=None):
+        with _lock:
+            CALLS[endpoint] += 1
+        delay = LATENCY + random.uniform(0, JITTER)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return load_fixture(endpoint, key)
+
+    async def get_match_details(self, match_id):
+        return await self._get('match_details', match_id)
+
+    async def get_match_comments(self, match_id):
+        return await self._get('match_comments', match_id)
+
+    async def get_match_odds(self, match_id, ccode3="GBR"):
+        return await self._get('match_odds', match_id)
+
+    async def get_tv_listings(self, match_id, country_code="GB"):
+        return await self._get('tv_listings', match_id)
+
+    async def standings(self, league_id):
+        return await self._get('standings', league_id)
@@ -1,20 +1,30 @@
 import json
-import asyncio
-from fotmob import FotMob
+
+# Cold start is dominated by asyncio (~50 ms) and the FotMob client (aiohttp),
+# so every function imports them where it uses them; a 400 loads neither.
+
+# Batch mode (?ids=1,2,3) limits
+MAX_BATCH_IDS = 20
+BATCH_CONCURRENCY = 4
 
 def handler(event, context):
     """
     Netlify Function Handler (Python)
     Fetches comprehensive match data from FotMob for 'fully loaded' site.
+    Pass `id` for a single match or `ids` (comma separated) for a batch.
     """
-    query_params = event.get('queryStringParameters', {})
+    query_params = event.get('queryStringParameters') or {}
     match_id = query_params.get('id')
-    
+    batch_ids = query_params.get('ids')
+
     headers = {
         'Content-Type': 'application/json',
         'Access-Control-Allow-Origin': '*'
     }
 
+    if batch_ids:
+        return batch_handler(batch_ids, headers)
+
     if not match_id:
         return {
             'statusCode': 400,
@@ -22,19 +32,15 @@ def handler(event, context):
             'body': json.dumps({'error': 'Missing match id'})
         }
 
-    clean_id_str = match_id
-    if match_id.startswith('fm-'):
-        clean_id_str = match_id.replace('fm-', '')
-
-    try:
-        clean_id = int(clean_id_str)
-    except ValueError:
+    clean_id = parse_match_id(match_id)
+    if clean_id is None:
          return {
             'statusCode': 400,
             'headers': headers,
             'body': json.dumps({'error': 'Invalid match id format'})
         }
 
+    import asyncio
     try:
         data = asyncio.run(fetch_match_data(clean_id))
         return {
@@ -50,7 +56,72 @@ def handler(event, context):
             'body': json.dumps({'error': str(e), 'details': 'Error orchestrating data fetch'})
         }
 
+def batch_handler(batch_ids, headers):
+    """Serves `?ids=1,fm-2,3`: one FotMob session, results keyed by the ids as sent."""
+    # numeric id -> every id in the request that names it ('fm-2' and '2')
+    raw_ids = {}
+    errors = {}
+    for raw_id in batch_ids.split(','):
+        raw_id = raw_id.strip()
+        if not raw_id:
+            continue
+        clean_id = parse_match_id(raw_id)
+        if clean_id is None:
+            errors[raw_id] = 'Invalid match id format'
+        elif raw_id not in raw_ids.setdefault(clean_id, []):
+            raw_ids[clean_id].append(raw_id)
+    match_ids = list(raw_ids)
+
+    if not match_ids and not errors:
+        return {
+            'statusCode': 400,
+            'headers': headers,
+            'body': json.dumps({'error': 'Missing match ids'})
+        }
+
+    if len(match_ids) > MAX_BATCH_IDS:
+        return {
+            'statusCode': 400,
+            'headers': headers,
+            'body': json.dumps({'error': f'Too many match ids (max {MAX_BATCH_IDS})'})
+        }
+
+    import asyncio
+    try:
+        fetched, fetch_errors = asyncio.run(fetch_batch_match_data(match_ids)) if match_ids else ({}, {})
+        matches = {}
+        for clean_id, aliases in raw_ids.items():
+            for raw_id in aliases:
+                if clean_id in fetched:
+                    matches[raw_id] = fetched[clean_id]
+                else:
+                    errors[raw_id] = fetch_errors[clean_id]
+        return {
+            'statusCode': 200,
+            'headers': headers,
+            'body': json.dumps({'matches': matches, 'errors': errors})
+        }
+    except Exception as e:
+        print(f"Match Details Batch Error: {str(e)}")
+        return {
+            'statusCode': 500,
+            'headers': headers,
+            'body': json.dumps({'error': str(e), 'details': 'Error orchestrating batch fetch'})
+        }
+
+def parse_match_id(match_id):
+    """Strip the scraper's 'fm-' prefix and return the numeric id, or None if invalid."""
+    clean_id_str = match_id
+    if match_id.startswith('fm-'):
+        clean_id_str = match_id.replace('fm-', '')
+
+    try:
+        return int(clean_id_str)
+    except ValueError:
+        return None
+
 async def fetch_with_timeout(coro, timeout=5, default=None):
+    import asyncio
     try:
         return await asyncio.wait_for(coro, timeout=timeout)
     except Exception as e:
@@ -59,21 +130,60 @@ async def fetch_with_timeout(coro, timeout=5, default=None):
 
 async def fetch_match_data(match_id):
     """Parallel fetching of all relevant match endpoints with timeouts."""
+    from fotmob import FotMob
     async with FotMob(proxy_url="") as fotmob:
-        # We target the most data-rich endpoints
-        # Note: some endpoints might fail for certain matches, we handle those gracefully
-        results = await asyncio.gather(
-            fetch_with_timeout(fotmob.get_match_details(match_id), timeout=8, default={}),
-            fetch_with_timeout(fotmob.get_match_comments(match_id), timeout=5, default=[]),
-            fetch_with_timeout(fotmob.get_match_odds(match_id), timeout=5, default={}),
-            fetch_with_timeout(fotmob.get_tv_listings(match_id, "US"), timeout=5, default={}),
-            return_exceptions=True
-        )
-        
-        # results will contain the defaults or exceptions if gather itself failed (unlikely)
-        return {
-            'details': results[0] if not isinstance(results[0], Exception) else {},
-            'comments': results[1] if not isinstance(results[1], Exception) else [],
-            'odds': results[2] if not isinstance(results[2], Exception) else {},
-            'tv': results[3] if not isinstance(results[3], Exception) else {}
-        }
+        return await fetch_match_endpoints(fotmob, match_id)
+
+async def fetch_batch_match_data(match_ids, concurrency=BATCH_CONCURRENCY):
+    """
+    Fetch several matches over one session, at most `concurrency` matches at a time.
+    Returns ({match_id: data}, {match_id: error message}).
+    """
+    import asyncio
+    from fotmob import FotMob
+
+    semaphore = asyncio.Semaphore(concurrency)
+    matches = {}
+    errors = {}
+
+    async with FotMob(proxy_url="") as fotmob:
+        async def fetch_one(match_id):
+            async with semaphore:
+                data = await fetch_match_endpoints(fotmob, match_id)
+            # Details fall back to {} when FotMob fails or times out; without
+            # them the match is unusable, so report it under `errors`.
+            if not data['details']:
+                raise ValueError('Match details unavailable')
+            return data
+
+        results = await asyncio.gather(*(fetch_one(match_id) for match_id in match_ids), return_exceptions=True)
+
+    for match_id, result in zip(match_ids, results):
+        if isinstance(result, Exception):
+            print(f"Match {match_id} failed: {result}")
+            errors[match_id] = str(result)
+        else:
+            matches[match_id] = result
+
+    return matches, errors
+
+async def fetch_match_endpoints(fotmob, match_id):
+    """Fetch every endpoint for one match using an open FotMob session."""
+    import asyncio
+    # We target the most data-rich endpoints
+    # Note: some endpoints might fail for certain matches, we handle those gracefully
+    results = await asyncio.gather(
+        fetch_with_timeout(fotmob.get_match_details(match_id), timeout=8, default={}),
+        fetch_with_timeout(fotmob.get_match_comments(match_id), timeout=5, default=[]),
+        fetch_with_timeout(fotmob.get_match_odds(match_id), timeout=5, default={}),
+        fetch_with_timeout(fotmob.get_tv_listings(match_id, "US"), timeout=5, default={}),
+        return_exceptions=True
+    )
+
+    # results will contain the defaults or exceptions if gather itself failed (unlikely)
+    return {
+        'details': results[0] if not isinstance(results[0], Exception) else {},
+        'comments': results[1] if not isinstance(results[1], Exception) else [],
+        'odds': results[2] if not isinstance(results[2], Exception) else {},
+        'tv': results[3] if not isinstance(results[3], Exception) else {}
+    }
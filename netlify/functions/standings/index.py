@@ -1,14 +1,19 @@
 import json
-import asyncio
-from fotmob import FotMob
+
+from standings_table import normalize_standings
+
+# Rejected requests never need the event loop or FotMob: asyncio is imported
+# in handler() after the league id parses, fotmob in fetch_standings().
 
 def handler(event, context):
     """
     Netlify Function for League Standings.
+    Returns the normalized columnar table; pass `full=1` for FotMob's raw payload.
     """
-    query_params = event.get('queryStringParameters', {})
+    query_params = event.get('queryStringParameters') or {}
     league_id = query_params.get('id')
-    
+    full = query_params.get('full') in ('1', 'true')
+
     headers = {
         'Content-Type': 'application/json',
         'Access-Control-Allow-Origin': '*'
@@ -30,12 +35,16 @@ def handler(event, context):
             'body': json.dumps({'error': 'Invalid league id format'})
         }
 
+    import asyncio
     try:
         data = asyncio.run(fetch_standings(clean_id))
+        if not full:
+            data = normalize_standings(data)
+            headers['Cache-Control'] = 'public, max-age=600, stale-while-revalidate=3600'
         return {
             'statusCode': 200,
             'headers': headers,
-            'body': json.dumps(data)
+            'body': json.dumps(data, separators=(',', ':'))
         }
     except Exception as e:
         return {
@@ -45,6 +54,7 @@ def handler(event, context):
         }
 
 async def fetch_standings(league_id):
+    from fotmob import FotMob
     async with FotMob(proxy_url="") as fotmob:
         # Get standings
         standings = await fotmob.standings(league_id)
@@ -0,0 +1,73 @@
+"""
+Normalized standings format, shared by this function and the scraper's
+public/data/standings snapshots. Standard library only, so the scraper can
+load it without FotMob.
+"""
+
+# Columns of the normalized table, in order
+TABLE_COLUMNS = ['rank', 'id', 'name', 'shortName', 'played', 'wins', 'draws', 'losses', 'goalDiff', 'pts', 'form']
+
+def normalize_standings(raw):
+    """
+    Reduce FotMob's standings payload to what Standings.jsx renders.
+
+    Each table is columnar: `teams` maps every column in TABLE_COLUMNS to a
+    list with one entry per team, in table order.
+    """
+    entries = raw if isinstance(raw, list) else [raw]
+    league = {}
+    tables = []
+
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        data = entry.get('data', entry)
+        if not isinstance(data, dict):
+            continue
+
+        if not league:
+            league = {
+                'leagueId': data.get('leagueId'),
+                'leagueName': data.get('leagueName'),
+                'country': data.get('ccode'),
+                'season': data.get('selectedSeason')
+            }
+
+        # Composite leagues (groups, conferences) carry one table per group
+        if isinstance(data.get('tables'), list):
+            groups = [(t.get('leagueName'), t.get('table')) for t in data['tables'] if isinstance(t, dict)]
+        else:
+            groups = [(data.get('leagueName'), data.get('table'))]
+
+        for name, table in groups:
+            if isinstance(table, dict):
+                tables.append(_columnar_table(name, table))
+
+    return dict(league, tables=tables)
+
+def _columnar_table(name, table):
+    rows = table.get('all') or []
+    form_by_team = {}
+    for team in table.get('form') or []:
+        if isinstance(team, dict):
+            form_by_team[team.get('id')] = ''.join(
+                str(f.get('resultString', '')) for f in team.get('form') or [] if isinstance(f, dict)
+            )
+
+    teams = {column: [] for column in TABLE_COLUMNS}
+    for position, row in enumerate(rows, 1):
+        if not isinstance(row, dict):
+            continue
+        teams['rank'].append(row.get('idx') or position)
+        teams['id'].append(row.get('id'))
+        teams['name'].append(row.get('name'))
+        teams['shortName'].append(row.get('shortName') or row.get('name'))
+        teams['played'].append(row.get('played'))
+        teams['wins'].append(row.get('wins'))
+        teams['draws'].append(row.get('draws'))
+        teams['losses'].append(row.get('losses'))
+        teams['goalDiff'].append(row.get('goalConDiff'))
+        teams['pts'].append(row.get('pts'))
+        teams['form'].append(form_by_team.get(row.get('id'), ''))
+
+    return {'name': name, 'teams': teams}
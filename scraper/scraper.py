@@ -8,6 +8,7 @@ import json
 import logging
 import asyncio
 import requests
+import importlib.util
 from datetime import datetime, timezone, timedelta
 
 # Library imports
@@ -30,6 +31,9 @@ logger = logging.getLogger(__name__)
 
 # Constants
 OUTPUT_PATH = os.path.join(os.path.dirname(__file__), '..', 'public', 'data', 'scores.json')
+STANDINGS_DIR = os.path.join(os.path.dirname(__file__), '..', 'public', 'data', 'standings')
+STANDINGS_CONCURRENCY = 4
+STANDINGS_TABLE = os.path.join(os.path.dirname(__file__), '..', 'netlify', 'functions', 'standings', 'standings_table.py')
 
 async def get_fotmob_wrapper_data():
     """Layer 1: Using fotmob-wrapper"""
@@ -182,6 +186,62 @@ def get_demo_fallback():
         m.setdefault('homeScore', None); m.setdefault('awayScore', None); m.setdefault('time', None)
     return demo
 
+def load_previous_statuses():
+    """Match id -> status from the last run's scores.json"""
+    try:
+        with open(OUTPUT_PATH, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {m.get('id'): m.get('status') for m in previous.get('matches', [])}
+
+def find_finished_leagues(matches, previous_statuses):
+    """League ids with a match that moved to FINISHED since the last run"""
+    league_ids = set()
+    for m in matches:
+        if m.get('status') != 'FINISHED' or m.get('leagueId') is None:
+            continue
+        previous = previous_statuses.get(m.get('id'))
+        if previous and previous != 'FINISHED':
+            league_ids.add(m['leagueId'])
+    return league_ids
+
+def load_standings_normalizer():
+    """Snapshots share the standings function's normalized format"""
+    spec = importlib.util.spec_from_file_location('standings_table', STANDINGS_TABLE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.normalize_standings
+
+async def update_standings_snapshots(league_ids):
+    """Regenerate public/data/standings/<leagueId>.json for the given leagues"""
+    if not FOT_AVAILABLE or not league_ids:
+        return
+
+    logger.info(f"Regenerating standings for {len(league_ids)} leagues...")
+    semaphore = asyncio.Semaphore(STANDINGS_CONCURRENCY)
+
+    try:
+        os.makedirs(STANDINGS_DIR, exist_ok=True)
+        normalize_standings = load_standings_normalizer()
+        async with FotMob(proxy_url="") as fotmob:
+            async def snapshot(league_id):
+                async with semaphore:
+                    try:
+                        standings = await fotmob.standings(league_id)
+                    except Exception as e:
+                        logger.warning(f"Standings for league {league_id} failed: {e}")
+                        return
+                if not standings:
+                    return
+                path = os.path.join(STANDINGS_DIR, f"{league_id}.json")
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump(normalize_standings(standings), f, ensure_ascii=False, separators=(',', ':'))
+
+            await asyncio.gather(*(snapshot(league_id) for league_id in sorted(league_ids)))
+    except Exception as e:
+        logger.warning(f"Standings snapshots failed: {e}")
+
 async def scrape():
     logger.info("🚀 EVaultHub Scraper Starting...")
     
@@ -214,6 +274,10 @@ async def scrape():
     status_order = {'LIVE': 0, 'SCHEDULED': 1, 'FINISHED': 2}
     cleaned.sort(key=lambda x: status_order.get(x['status'], 999))
     
+    # Standings only change when a match finishes
+    finished_leagues = find_finished_leagues(cleaned, load_previous_statuses())
+    await update_standings_snapshots(finished_leagues)
+
     # Output Creation
     output = {
         'lastUpdated': datetime.now(timezone.utc).isoformat(),
@@ -1,35 +1,1057 @@
+import os
+import re
+import csv
+import json
+import gzip
+import zlib
+import hashlib
+import importlib.util
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-from datetime import datetime
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 import time
-from typing import List, Dict
+import random
+import asyncio
+import argparse
+from urllib.parse import urlparse, parse_qsl
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import lxml
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# aiohttp is slow to import and only AsyncSoccerwayScraper needs it; imported in open()
+AIOHTTP_AVAILABLE = importlib.util.find_spec('aiohttp') is not None
+
+# pyarrow is slow to import, so ParquetMatchWriter imports it on first use
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+# Same for pandas, used only to parse kickoff times in batches
+PANDAS_AVAILABLE = importlib.util.find_spec('pandas') is not None
+
+# BeautifulSoup tree builders, fastest first
+PARSER_BACKENDS = ['lxml', 'html.parser', 'html5lib']
+DEFAULT_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# Match row layouts, probed in order. `cells` maps a td class to a field.
+MATCH_CELLS = {
+    'time': 'time',
+    'team-a': 'home_team',
+    'team-b': 'away_team',
+    'score': 'score',
+    'tournament': 'league',
+}
+
+SELECTOR_PROFILES = [
+    {'name': 'match-row', 'tag': 'div', 'class': 'match-row', 'cells': MATCH_CELLS},
+    {'name': 'match-table', 'tag': 'tr', 'class': 'match', 'cells': MATCH_CELLS},
+]
+
+# Match schema of scraper/scraper.py (public/data/scores.json)
+SCORES_FIELDS = ['id', 'home', 'away', 'homeScore', 'awayScore', 'homeImage', 'awayImage',
+                 'league', 'leagueId', 'country', 'status', 'minute', 'time']
+
+SCORE_RE = re.compile(r'^(\d+)\s*[-\u2013]\s*(\d+)')
+KICKOFF_RE = re.compile(r'^(\d{1,2}):(\d{2})$')
+DAY_RE = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{2}|\d{4})$')
+MINUTE_RE = re.compile(r"^(?:\d{1,3}(?:\+\d{1,2})?'|HT)$")
+# Rows with these in the score or time cell are dropped, as scraper.py drops them
+CALLED_OFF = {'P-P', 'PSTP', 'POSTP.', 'CANC.', 'CANC', 'ABAN.', 'ABD'}
+
+# A page yielding less than this share of its URL pattern's usual rows is flagged
+DRIFT_RATIO = 0.5
+# Pages are only checked for drift once the usual yield is at least this many rows
+DRIFT_MIN_ROWS = 5
+
+def compile_profiles(profiles: List[Dict]) -> List[Dict]:
+    """Compile selector profiles into CSS row selectors"""
+    compiled = []
+    for profile in profiles:
+        compiled.append({
+            'name': profile['name'],
+            'rows': soupsieve.compile(f"{profile['tag']}.{profile['class']}"),
+            'fields': profile['cells'],
+        })
+    return compiled
+
+def profile_strainer(profiles: List[Dict]) -> SoupStrainer:
+    """SoupStrainer keeping only the row elements of the given profiles"""
+    # Class attributes may reach the strainer unsplit, hence the regex
+    classes = '|'.join(re.escape(profile['class']) for profile in profiles)
+    return SoupStrainer(
+        sorted({profile['tag'] for profile in profiles}),
+        class_=re.compile(rf'(?:^|\s)(?:{classes})(?:\s|$)')
+    )
+
+def url_pattern(url: str) -> str:
+    """Group URLs sharing a page layout: numbers and query values are dropped"""
+    parsed = urlparse(url)
+    path = re.sub(r'\d+', '{n}', parsed.path or '/')
+    keys = sorted(key for key, _ in parse_qsl(parsed.query))
+    return f"{parsed.netloc}{path}" + (f"?{'&'.join(keys)}" if keys else '')
+
+COMPILED_PROFILES = compile_profiles(SELECTOR_PROFILES)
+# Only match rows are built into the tree when parsing is restricted
+MATCH_ROW_STRAINER = profile_strainer(SELECTOR_PROFILES)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
 
 class SoccerwayScraperError(Exception):
     """Custom exception for scraper errors"""
     pass
 
-class SoccerwayScraper:
+class CircuitOpenError(SoccerwayScraperError):
+    """Raised without a request while a host's circuit breaker is open"""
+    pass
+
+class RetryPolicy:
     """
-    A web scraper for extracting football match scores from soccerway.com
+    Exponential backoff with full jitter for transient failures
+    
+    Only idempotent requests (the scrapers only GET) are retried, and only
+    on connection errors, timeouts and the transient statuses below.
+    """
+    
+    RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+    
+    def __init__(self, max_retries: int = 3, backoff: float = 1, max_backoff: float = 60,
+                 jitter: bool = True, retry_statuses=None, respect_retry_after: bool = True):
+        """
+        Initialize the policy
+        
+        Args:
+            max_retries: Retries after the first attempt (0 disables retrying)
+            backoff: Base delay in seconds, doubled per attempt
+            max_backoff: Upper bound for any single wait, Retry-After included
+            jitter: Wait a random time up to the backoff instead of exactly it
+            retry_statuses: HTTP statuses treated as transient
+            respect_retry_after: Wait as long as the server's Retry-After asks
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses) if retry_statuses is not None else self.RETRY_STATUSES
+        self.respect_retry_after = respect_retry_after
+    
+    def retryable(self, status: int) -> bool:
+        return status in self.retry_statuses
+    
+    def wait(self, attempt: int, retry_after: str = None) -> float:
+        """Seconds to wait before retry number `attempt + 1`"""
+        if retry_after and self.respect_retry_after:
+            seconds = parse_retry_after(retry_after)
+            if seconds is not None:
+                return min(seconds, self.max_backoff)
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        return random.uniform(0, delay) if self.jitter else delay
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """Seconds requested by a Retry-After header (delta-seconds or HTTP date)"""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker
+    
+    After `failure_threshold` consecutive failed attempts a host's circuit
+    opens and requests to it fail fast with CircuitOpenError. After
+    `reset_timeout` seconds one trial request is let through (half-open):
+    success closes the circuit, failure opens it again.
+    """
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        # host -> {'failures': int, 'opened_at': float or None, 'trial_at': float or None}
+        self.hosts = {}
+    
+    def state(self, host: str) -> str:
+        entry = self.hosts.get(host)
+        if not entry or entry['opened_at'] is None:
+            return 'closed'
+        if time.monotonic() - entry['opened_at'] < self.reset_timeout:
+            return 'open'
+        return 'half-open'
+    
+    def before_request(self, host: str):
+        """Raise CircuitOpenError unless a request to the host may go out"""
+        state = self.state(host)
+        if state == 'closed':
+            return
+        entry = self.hosts[host]
+        now = time.monotonic()
+        # One trial at a time; a trial that never reported back expires
+        if state == 'open' or (entry['trial_at'] is not None and now - entry['trial_at'] < self.reset_timeout):
+            raise CircuitOpenError(f"Circuit open for {host} after {entry['failures']} failures")
+        entry['trial_at'] = now
+    
+    def record_success(self, host: str):
+        self.hosts.pop(host, None)
+    
+    def record_failure(self, host: str):
+        entry = self.hosts.setdefault(host, {'failures': 0, 'opened_at': None, 'trial_at': None})
+        entry['failures'] += 1
+        if entry['trial_at'] is not None or entry['failures'] >= self.failure_threshold:
+            entry['opened_at'] = time.monotonic()
+            entry['trial_at'] = None
+
+def body_hash(body: bytes) -> str:
+    """Content hash identifying a page body"""
+    return hashlib.sha256(body).hexdigest()
+
+class PageCache:
+    """
+    Per-URL validators (ETag / Last-Modified), body hash and parsed matches
+    
+    Lets the scrapers send conditional requests and skip parsing when a page
+    comes back 304 or with an identical body. Only the small per-URL entries
+    (hash and validators) are held in memory, from <root>/index.jsonl, an
+    append-only log where the latest line for a URL wins. Each URL's matches
+    live in their own file, <root>/matches/<2 hex>/<url hash>.json, written
+    when the page is parsed and read only when it is reused.
+    """
+    
+    def __init__(self, root: str = '.soccerway_cache', compact_ratio: float = 2):
+        """
+        Initialize the cache
+        
+        Args:
+            root: Cache directory
+            compact_ratio: Rewrite the index on save() once it holds this many
+                lines per URL
+        """
+        self.root = root
+        self.index_path = os.path.join(root, 'index.jsonl')
+        self.compact_ratio = compact_ratio
+        self.entries = {}
+        self.stats = {'not_modified': 0, 'unchanged': 0, 'parsed': 0}
+        self._index_file = None
+        self._lines = 0
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # Torn last line of an interrupted run
+                    self._lines += 1
+                    self.entries[entry.pop('url')] = entry
+    
+    def matches_path(self, url: str) -> str:
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.root, 'matches', key[:2], key + '.json')
+    
+    def _load_matches(self, url: str) -> Optional[List[Dict]]:
+        try:
+            with open(self.matches_path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _append(self, url: str, entry: Dict):
+        if self._index_file is None:
+            os.makedirs(self.root, exist_ok=True)
+            self._index_file = open(self.index_path, 'a', encoding='utf-8')
+        self._index_file.write(json.dumps(dict(entry, url=url), ensure_ascii=False) + '\n')
+        self._index_file.flush()
+        self._lines += 1
+        self.entries[url] = entry
+    
+    def conditional_headers(self, url: str) -> Dict:
+        """Request headers revalidating the cached copy of a URL"""
+        entry = self.entries.get(url)
+        headers = {}
+        # A 304 is only useful while the matches to answer it with are still there
+        if entry and os.path.exists(self.matches_path(url)):
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def not_modified(self, url: str) -> List[Dict]:
+        """Cached matches for a URL the server answered 304 for"""
+        matches = self._load_matches(url)
+        if matches is None:
+            raise SoccerwayScraperError(f"Got 304 for {url} but its cached matches are gone")
+        self.stats['not_modified'] += 1
+        return matches
+    
+    def lookup(self, url: str, digest: str, validators: Dict = None) -> Optional[List[Dict]]:
+        """Cached matches if the body hash is unchanged, else None"""
+        entry = self.entries.get(url)
+        if not entry or entry.get('hash') != digest:
+            return None
+        matches = self._load_matches(url)
+        if matches is None:
+            return None
+        self.stats['unchanged'] += 1
+        if validators and any(entry.get(k) != v for k, v in validators.items()):
+            self._append(url, dict(entry, **validators))
+        return matches
+    
+    def store(self, url: str, digest: str, validators: Dict, matches: List[Dict]):
+        """Remember a freshly parsed page"""
+        self.stats['parsed'] += 1
+        path = self.matches_path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(matches, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        # Index line last: an entry always has its matches file
+        entry = {'hash': digest, 'fetched_at': datetime.now().isoformat()}
+        entry.update(validators or {})
+        self._append(url, entry)
+    
+    def save(self):
+        """Close the index, first rewriting it if superseded lines have piled up"""
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
+        if self.entries and self._lines > self.compact_ratio * len(self.entries):
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for url, entry in self.entries.items():
+                    f.write(json.dumps(dict(entry, url=url), ensure_ascii=False) + '\n')
+            os.replace(tmp_path, self.index_path)
+            self._lines = len(self.entries)
+
+class PageArchive:
+    """
+    Content-addressed archive of raw page bodies
+    
+    Bodies are stored compressed once per content hash (body_hash) at
+    <root>/objects/<2 hex>/<hash>.html.zst (or .html.gz without zstandard).
+    <root>/index.jsonl is an append-only log of url -> hash, written when a
+    URL's body changes; the latest line for a URL wins. `reparse` re-runs
+    extraction over an archive without touching the network.
+    """
+    
+    EXTENSIONS = {'zstd': '.html.zst', 'gzip': '.html.gz'}
+    
+    def __init__(self, root: str = 'soccerway_archive', compression: str = None, level: int = None):
+        """
+        Initialize the archive
+        
+        Args:
+            root: Archive directory
+            compression: 'zstd' or 'gzip' for new bodies; zstd when installed
+            level: Compression level (default: 10 for zstd, 6 for gzip)
+        """
+        compression = compression or ('zstd' if ZSTD_AVAILABLE else 'gzip')
+        if compression not in self.EXTENSIONS:
+            raise SoccerwayScraperError(f"Unknown compression {compression}. Available: zstd, gzip")
+        if compression == 'zstd' and not ZSTD_AVAILABLE:
+            raise SoccerwayScraperError("zstd compression requires zstandard")
+        self.root = root
+        self.compression = compression
+        self.level = level if level is not None else (10 if compression == 'zstd' else 6)
+        self.index_path = os.path.join(root, 'index.jsonl')
+        self.index = {}
+        self.stats = {'stored': 0, 'deduplicated': 0}
+        self._index_file = None
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # Torn last line of an interrupted run
+                    self.index[entry['url']] = entry
+    
+    def object_path(self, digest: str, compression: str = None) -> str:
+        ext = self.EXTENSIONS[compression or self.compression]
+        return os.path.join(self.root, 'objects', digest[:2], digest + ext)
+    
+    def _find(self, digest: str) -> Optional[Tuple[str, str]]:
+        """(path, compression) of a stored body, whatever it was compressed with"""
+        for compression in self.EXTENSIONS:
+            path = self.object_path(digest, compression)
+            if os.path.exists(path):
+                return path, compression
+        return None
+    
+    def put(self, url: str, body: bytes) -> str:
+        """
+        Archive a fetched body
+        
+        Args:
+            url: URL the body was fetched from
+            body: Raw response body
+            
+        Returns:
+            The body's content hash
+        """
+        digest = body_hash(body)
+        if self._find(digest) is None:
+            path = self.object_path(digest)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if self.compression == 'zstd':
+                data = zstandard.ZstdCompressor(level=self.level).compress(body)
+            else:
+                data = gzip.compress(body, compresslevel=self.level, mtime=0)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self.stats['stored'] += 1
+        else:
+            self.stats['deduplicated'] += 1
+        
+        if self.index.get(url, {}).get('hash') != digest:
+            entry = {'url': url, 'hash': digest, 'fetched_at': datetime.now().isoformat()}
+            if self._index_file is None:
+                os.makedirs(self.root, exist_ok=True)
+                self._index_file = open(self.index_path, 'a', encoding='utf-8')
+            self._index_file.write(json.dumps(entry) + '\n')
+            self._index_file.flush()
+            self.index[url] = entry
+        return digest
+    
+    def get(self, digest: str) -> bytes:
+        """Decompressed body for a content hash"""
+        found = self._find(digest)
+        if found is None:
+            raise SoccerwayScraperError(f"Body {digest} is not in the archive at {self.root}")
+        path, compression = found
+        with open(path, 'rb') as f:
+            data = f.read()
+        if compression == 'zstd':
+            if not ZSTD_AVAILABLE:
+                raise SoccerwayScraperError(f"{path} is zstd-compressed; install zstandard to read it")
+            decompressor = zstandard.ZstdDecompressor().decompressobj()
+            try:
+                body = decompressor.decompress(data)
+            except zstandard.ZstdError as e:
+                raise SoccerwayScraperError(f"{path} is corrupt: {e}") from e
+            # A truncated frame decompresses without error, just short
+            if not decompressor.eof:
+                raise SoccerwayScraperError(f"{path} is truncated")
+            return body
+        try:
+            return gzip.decompress(data)
+        except (OSError, EOFError, zlib.error) as e:
+            raise SoccerwayScraperError(f"{path} is corrupt: {e}") from e
+    
+    def latest(self, url: str) -> bytes:
+        """Most recently archived body for a URL"""
+        if url not in self.index:
+            raise SoccerwayScraperError(f"{url} is not in the archive at {self.root}")
+        return self.get(self.index[url]['hash'])
+    
+    def close(self):
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
+
+class CsvMatchWriter:
+    """
+    Stream matches into CSV as pages are scraped
+    
+    Without partitioning everything goes to `path`. With `partitioned=True`,
+    `path` is a directory and each partition (a date) gets its own file at
+    <path>/date=<partition>/matches.csv. Files are appended to by default, so
+    a resumed run continues where it stopped; mode='w' starts each file over.
     """
     
-    def __init__(self, timeout: int = 10, delay: float = 1):
+    def __init__(self, path: str, fieldnames: List[str] = None, partitioned: bool = False, max_open: int = 32,
+                 mode: str = 'a'):
+        """
+        Initialize the writer
+        
+        Args:
+            path: Output file, or output directory when partitioned
+            fieldnames: CSV columns; taken from the first match when omitted
+            partitioned: Write one file per partition
+            max_open: Most partition files kept open at once
+            mode: 'a' to append to existing files, 'w' to truncate them
+        """
+        if mode not in ('a', 'w'):
+            raise ValueError(f"mode must be 'a' or 'w', not {mode!r}")
+        self.path = path
+        self.fieldnames = fieldnames
+        self.partitioned = partitioned
+        self.max_open = max_open
+        self.mode = mode
+        self.rows_written = 0
+        self._files = OrderedDict()
+        # Files opened by this writer; a file evicted and reopened is appended to
+        self._opened = set()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def partition_path(self, partition: str = None) -> str:
+        if not self.partitioned:
+            return self.path
+        if partition is None:
+            raise SoccerwayScraperError("Partitioned writer needs a partition for every row")
+        return os.path.join(self.path, f"date={partition}", 'matches.csv')
+    
+    def _writer(self, partition: str = None):
+        path = self.partition_path(partition)
+        if path in self._files:
+            self._files.move_to_end(path)
+            return self._files[path][1]
+        
+        if len(self._files) >= self.max_open:
+            _, (f, _) = self._files.popitem(last=False)
+            f.close()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        mode = 'a' if path in self._opened else self.mode
+        self._opened.add(path)
+        is_new = mode == 'w' or not os.path.exists(path) or os.path.getsize(path) == 0
+        f = open(path, mode, newline='', encoding='utf-8')
+        writer = csv.DictWriter(f, fieldnames=self.fieldnames, extrasaction='ignore')
+        if is_new:
+            writer.writeheader()
+        self._files[path] = (f, writer)
+        return writer
+    
+    def write(self, match: Dict, partition: str = None):
+        """Append one match"""
+        if self.fieldnames is None:
+            self.fieldnames = list(match.keys())
+        self._writer(partition).writerow(match)
+        self.rows_written += 1
+    
+    def write_many(self, matches: List[Dict], partition: str = None):
+        """Append a page of matches"""
+        for match in matches:
+            self.write(match, partition)
+    
+    def close_partition(self, partition: str = None):
+        """Finish a partition's file so its rows are on disk"""
+        path = self.partition_path(partition)
+        if path in self._files:
+            self._files.pop(path)[0].close()
+    
+    def reset_partition(self, partition: str):
+        """Delete a partition's rows, e.g. a day left half-written by an interrupted run"""
+        self.close_partition(partition)
+        path = self.partition_path(partition)
+        directory = os.path.dirname(path)
+        stem, ext = os.path.splitext(os.path.basename(path))
+        if os.path.isdir(directory):
+            for name in os.listdir(directory):
+                if name.startswith(stem) and name.endswith(ext):
+                    os.remove(os.path.join(directory, name))
+    
+    def close(self):
+        for f, _ in self._files.values():
+            f.close()
+        self._files.clear()
+
+class ParquetMatchWriter(CsvMatchWriter):
+    """
+    Stream matches into Parquet (requires pyarrow)
+    
+    Rows are buffered per partition and flushed as row groups of
+    `row_group_size`, so memory stays bounded. Team and league columns are
+    dictionary-encoded, normalized scores are integers; everything else is
+    stored as strings.
+    """
+    
+    DICTIONARY_COLUMNS = ('home_team', 'away_team', 'league', 'home', 'away')
+    INTEGER_COLUMNS = ('homeScore', 'awayScore', 'leagueId')
+    
+    def __init__(self, path: str, fieldnames: List[str] = None, partitioned: bool = False,
+                 max_open: int = 32, row_group_size: int = 10000):
+        """
+        Initialize the writer
+        
+        Args:
+            path: Output file, or output directory when partitioned
+            fieldnames: Columns; taken from the first match when omitted
+            partitioned: Write one file per partition (<path>/date=<partition>/matches.parquet)
+            max_open: Most partition files kept open at once
+            row_group_size: Rows buffered per partition before a row group is written
+        """
+        if not PYARROW_AVAILABLE:
+            raise SoccerwayScraperError("ParquetMatchWriter requires pyarrow")
+        import pyarrow
+        import pyarrow.parquet
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        super().__init__(path, fieldnames, partitioned, max_open)
+        self.row_group_size = row_group_size
+        self._buffers = {}
+        self._schema = None
+    
+    def partition_path(self, partition: str = None) -> str:
+        path = super().partition_path(partition)
+        return path[:-len('.csv')] + '.parquet' if path.endswith('.csv') else path
+    
+    def _table(self, rows: List[Dict]):
+        pa = self._pa
+        if self._schema is None:
+            self._schema = pa.schema([
+                (name, pa.dictionary(pa.int32(), pa.string()) if name in self.DICTIONARY_COLUMNS
+                 else pa.int64() if name in self.INTEGER_COLUMNS else pa.string())
+                for name in self.fieldnames
+            ])
+        columns = {
+            name: [row.get(name) if name in self.INTEGER_COLUMNS or row.get(name) is None else str(row.get(name))
+                   for row in rows]
+            for name in self.fieldnames
+        }
+        return pa.Table.from_pydict(columns, schema=self._schema)
+    
+    def _flush(self, path: str):
+        rows = self._buffers.pop(path, None)
+        if not rows:
+            return
+        table = self._table(rows)
+        if path not in self._files:
+            if len(self._files) >= self.max_open:
+                # Its buffered rows go into its open file; _flush() would reorder or reopen it
+                oldest = next(iter(self._files))
+                pending = self._buffers.pop(oldest, None)
+                if pending:
+                    self._files[oldest].write_table(self._table(pending))
+                self._files.pop(oldest).close()
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            # A Parquet file cannot be appended to; a reopened partition gets a new part file
+            target = path
+            part = 1
+            while os.path.exists(target):
+                target = f"{path[:-len('.parquet')]}-{part}.parquet"
+                part += 1
+            self._files[path] = self._pq.ParquetWriter(target, table.schema)
+        self._files.move_to_end(path)
+        self._files[path].write_table(table)
+    
+    def write(self, match: Dict, partition: str = None):
+        """Buffer one match, writing a row group when the buffer is full"""
+        if self.fieldnames is None:
+            self.fieldnames = list(match.keys())
+        path = self.partition_path(partition)
+        self._buffers.setdefault(path, []).append(match)
+        self.rows_written += 1
+        if len(self._buffers[path]) >= self.row_group_size:
+            self._flush(path)
+    
+    def close_partition(self, partition: str = None):
+        """Flush and finish a partition's file so its rows are on disk"""
+        path = self.partition_path(partition)
+        self._flush(path)
+        if path in self._files:
+            self._files.pop(path).close()
+    
+    def close(self):
+        for path in list(self._buffers):
+            self._flush(path)
+        for writer in self._files.values():
+            writer.close()
+        self._files.clear()
+
+def response_validators(headers) -> Dict:
+    """ETag / Last-Modified of a response, for PageCache"""
+    validators = {}
+    if headers.get('ETag'):
+        validators['etag'] = headers['ETag']
+    if headers.get('Last-Modified'):
+        validators['last_modified'] = headers['Last-Modified']
+    return validators
+
+def _split_match(match: Dict, date_str: str = None) -> Optional[Dict]:
+    """
+    Scalar part of normalization: everything except the kickoff timestamp
+    
+    Returns the scores.json fields plus a '_kickoff' "YYYY-MM-DD HH:MM"
+    string (None when the date or clock time is unknown), or None for rows without both
+    teams and for called-off matches.
+    """
+    home = (match.get('home_team') or '').strip()
+    away = (match.get('away_team') or '').strip()
+    if not home or not away:
+        return None
+    
+    score = (match.get('score') or '').strip()
+    when = (match.get('time') or '').strip()
+    if score.upper() in CALLED_OFF or when.upper() in CALLED_OFF:
+        return None
+    
+    day, clock, minute = date_str, None, None
+    for text in (when, score):
+        if DAY_RE.match(text):
+            d, m, y = DAY_RE.match(text).groups()
+            day = f"{'20' + y if len(y) == 2 else y}-{int(m):02d}-{int(d):02d}"
+        elif KICKOFF_RE.match(text):
+            h, mi = KICKOFF_RE.match(text).groups()
+            clock = f"{int(h):02d}:{mi}"
+        elif MINUTE_RE.match(text):
+            minute = text
+    
+    goals = SCORE_RE.match(score)
+    home_score, away_score = (int(goals.group(1)), int(goals.group(2))) if goals else (None, None)
+    if minute:
+        status = 'LIVE'
+    elif goals:
+        status = 'FINISHED'
+    else:
+        status = 'SCHEDULED'
+    
+    # Stable across runs, unlike hash(); one fixture per day and pairing
+    key = f"{day}|{home}|{away}".lower().encode('utf-8')
+    return {
+        'id': f"sw-{hashlib.sha1(key).hexdigest()[:12]}",
+        'home': home,
+        'away': away,
+        'homeScore': home_score,
+        'awayScore': away_score,
+        'homeImage': None,
+        'awayImage': None,
+        'league': (match.get('league') or '').strip() or 'Football',
+        'leagueId': None,
+        'country': '',
+        'status': status,
+        'minute': minute,
+        '_kickoff': f"{day} {clock}" if day and clock else None,
+    }
+
+def normalize_match(match: Dict, date_str: str = None, tz: str = 'UTC') -> Optional[Dict]:
+    """
+    Convert one scraped row to the scores.json match schema
+    
+    Args:
+        match: Row from parse_matches() (home_team, away_team, score, time, league)
+        date_str: Page date (YYYY-MM-DD) for rows that only show a kickoff time
+        tz: Timezone the page shows kickoff times in
+        
+    Returns:
+        Match dict with the SCORES_FIELDS keys, or None if the row is unusable
+    """
+    normalized = normalize_matches([match], date_str, tz, vectorized=False)
+    return normalized[0] if normalized else None
+
+def normalize_matches(matches: List[Dict], date_str: str = None, tz: str = 'UTC',
+                      vectorized: bool = None) -> List[Dict]:
+    """
+    Convert scraped rows to the scores.json match schema of scraper/scraper.py
+    
+    Scores become integers, status is LIVE / FINISHED / SCHEDULED, and
+    kickoff becomes an ISO 8601 UTC timestamp, or None when the row shows no
+    clock time (live minute, FT, a bare date) or a local time that a DST
+    change skips or repeats, as scores.json producers leave unknown times. Called-off matches and rows missing a team are
+    dropped.
+    
+    Args:
+        matches: Rows from parse_matches()
+        date_str: Page date (YYYY-MM-DD) for rows that only show a kickoff time
+        tz: Timezone the page shows kickoff times in
+        vectorized: Parse timestamps with one pandas call; by default when
+            pandas is installed and there are enough rows to pay for it
+        
+    Returns:
+        List of match dicts with the SCORES_FIELDS keys
+    """
+    rows = [row for row in (_split_match(m, date_str) for m in matches) if row is not None]
+    kickoffs = [row.pop('_kickoff') for row in rows]
+    if vectorized is None:
+        vectorized = PANDAS_AVAILABLE and len(rows) >= 200
+    
+    if vectorized:
+        import pandas as pd
+        parsed = pd.to_datetime(pd.Series(kickoffs, dtype='object'), format='%Y-%m-%d %H:%M', errors='coerce')
+        parsed = parsed.dt.tz_localize(tz, ambiguous='NaT', nonexistent='NaT').dt.tz_convert('UTC')
+        times = [None if pd.isna(t) else t.isoformat() for t in parsed]
+    else:
+        from zoneinfo import ZoneInfo
+        zone = ZoneInfo(tz)
+        times = []
+        for kickoff in kickoffs:
+            try:
+                local = datetime.strptime(kickoff, '%Y-%m-%d %H:%M').replace(tzinfo=zone)
+            except (TypeError, ValueError):
+                times.append(None)
+                continue
+            utc = local.astimezone(timezone.utc)
+            # Like the pandas path, a time skipped or repeated by a DST change has no answer
+            skipped = utc.astimezone(zone).replace(tzinfo=None) != local.replace(tzinfo=None)
+            repeated = local.utcoffset() != local.replace(fold=1).utcoffset()
+            times.append(None if skipped or repeated else utc.isoformat())
+    
+    for row, when in zip(rows, times):
+        row['time'] = when
+    return rows
+
+class BaseSoccerwayScraper:
+    """
+    URL building, parsing and export shared by the sync and async scrapers
+    """
+    
+    def __init__(self, timeout: int = 10, delay: float = 1, parser: str = None, restrict: bool = True,
+                 cache: PageCache = None, retry: RetryPolicy = None, breaker: CircuitBreaker = None,
+                 archive: 'PageArchive' = None):
         """
         Initialize the scraper
         
         Args:
             timeout: Request timeout in seconds
             delay: Delay between requests in seconds (be respectful)
+            parser: BeautifulSoup tree builder (see PARSER_BACKENDS); lxml when installed
+            restrict: Build only match rows into the tree when extracting matches
+                (fetch_page still returns the whole page)
+            cache: Page cache enabling conditional requests and parse skipping
+            retry: Retry policy for transient failures (default: RetryPolicy())
+            breaker: Per-host circuit breaker (default: CircuitBreaker())
+            archive: Store every fetched body here for later re-parsing
         """
+        if parser is not None and parser not in PARSER_BACKENDS:
+            raise SoccerwayScraperError(f"Unknown parser {parser}. Available: {', '.join(PARSER_BACKENDS)}")
         self.base_url = "https://www.soccerway.com"
         self.timeout = timeout
         self.delay = delay
+        self.parser = parser or DEFAULT_PARSER
+        # html5lib ignores parse_only
+        self.restrict = restrict and self.parser != 'html5lib'
+        self.cache = cache
+        self.archive = archive
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        # URL pattern -> name of the profile that last matched it
+        self.profile_by_pattern = {}
+        # URL pattern -> moving average of rows per page
+        self.yield_by_pattern = {}
+        self.drift_events = []
+    
+    def date_url(self, date_str: str) -> str:
+        """URL of the matches page for a date (format: YYYY-MM-DD)"""
+        return f"{self.base_url}/match/?date={date_str}"
+    
+    def league_url(self, league_id: int) -> str:
+        """URL of a league's tournament page"""
+        return f"{self.base_url}/national/tournament/{league_id}/"
+    
+    def parse_page(self, content: bytes, matches_only: bool = False) -> BeautifulSoup:
+        """
+        Parse a fetched page body
+        
+        Args:
+            content: Raw response body
+            matches_only: The tree is only used to extract matches; with
+                `restrict`, only match rows are built into it
+            
+        Returns:
+            BeautifulSoup object of the parsed HTML
+        """
+        parse_only = MATCH_ROW_STRAINER if matches_only and self.restrict else None
+        return BeautifulSoup(content, self.parser, parse_only=parse_only)
+    
+    def parse_matches(self, soup: BeautifulSoup, url: str = None) -> List[Dict]:
+        """
+        Extract match rows from a parsed page
+        
+        Args:
+            soup: Parsed page
+            url: Page URL; the profile that matched is remembered for its
+                URL pattern so later pages skip failed probes
+            
+        Returns:
+            List of dictionaries containing match information
+        """
+        pattern = url_pattern(url) if url else None
+        profile, rows = self._select_rows(soup, self.profile_by_pattern.get(pattern))
+        matches = self._parse_rows(rows, profile)
+        if pattern:
+            self._record_yield(url, pattern, profile['name'] if profile else None, len(matches))
+        return matches
+    
+    def _parse_rows(self, rows, profile: Optional[Dict]) -> List[Dict]:
+        matches = []
+        for row in rows:
+            try:
+                match_data = self._parse_match_row(row, profile)
+                if match_data:
+                    matches.append(match_data)
+            except Exception as e:
+                print(f"Warning: Could not parse match row: {str(e)}")
+                continue
+        return matches
+    
+    def _retry_wait(self, url: str, attempt: int, status: Optional[int], error: str,
+                    retry_after: str = None) -> float:
+        """
+        Record a failed attempt and return how long to wait before retrying
+        
+        Raises SoccerwayScraperError when the failure is not transient or the
+        retries are used up.
+        """
+        host = urlparse(url).netloc
+        if status is not None and not self.retry.retryable(status):
+            # The host answered; the page itself is the problem
+            self.breaker.record_success(host)
+            raise SoccerwayScraperError(f"Failed to fetch {url}: {error}")
+        self.breaker.record_failure(host)
+        if attempt >= self.retry.max_retries:
+            raise SoccerwayScraperError(f"Failed to fetch {url} after {attempt + 1} attempts: {error}")
+        return self.retry.wait(attempt, retry_after)
+    
+    def _matches_from_body(self, url: str, body: bytes, validators: Dict = None) -> List[Dict]:
+        """Parse a fetched body, reusing the cached matches when it is unchanged"""
+        if self.cache is None:
+            return self.parse_matches(self.parse_page(body, matches_only=True), url)
+        
+        digest = body_hash(body)
+        cached = self.cache.lookup(url, digest, validators)
+        if cached is not None:
+            return cached
+        matches = self.parse_matches(self.parse_page(body, matches_only=True), url)
+        self.cache.store(url, digest, validators, matches)
+        return matches
+    
+    def _select_rows(self, soup: BeautifulSoup, preferred: Optional[str] = None):
+        """Return (profile, rows) for the first profile with rows, preferred profile first"""
+        profiles = sorted(COMPILED_PROFILES, key=lambda p: p['name'] != preferred)
+        for profile in profiles:
+            rows = profile['rows'].select(soup)
+            if rows:
+                return profile, rows
+        return None, []
+    
+    def _record_yield(self, url: str, pattern: str, profile_name: Optional[str], count: int):
+        """Remember the page's profile for its URL pattern and check it for drift"""
+        remembered = self.profile_by_pattern.get(pattern)
+        if profile_name:
+            if remembered and profile_name != remembered:
+                self._flag_drift(pattern, f"profile switched from {remembered} to {profile_name}")
+            self.profile_by_pattern[pattern] = profile_name
+        self._check_drift(url, pattern, profile_name, count)
+    
+    def _check_drift(self, url: str, pattern: str, profile_name: Optional[str], count: int):
+        """Flag pages whose yield drops well below their URL pattern's average"""
+        expected = self.yield_by_pattern.get(pattern)
+        if expected is not None and expected >= DRIFT_MIN_ROWS and count < expected * DRIFT_RATIO:
+            name = profile_name or 'no profile'
+            self._flag_drift(pattern, f"{url} yielded {count} rows ({name}), expected ~{expected:.0f}")
+        # Exponential moving average, so one odd page does not reset the baseline
+        self.yield_by_pattern[pattern] = count if expected is None else 0.8 * expected + 0.2 * count
+    
+    def _flag_drift(self, pattern: str, message: str):
+        self.drift_events.append({'pattern': pattern, 'message': message, 'at': datetime.now().isoformat()})
+        print(f"Warning: selector drift on {pattern}: {message}")
+    
+    def _parse_match_row(self, row, profile: Dict = None) -> Dict:
+        """
+        Parse a single match row to extract relevant information
+        
+        Args:
+            row: BeautifulSoup element representing a match
+            profile: Compiled selector profile the row was found with
+            
+        Returns:
+            Dictionary with match information or None if parsing fails
+        """
+        profile = profile or COMPILED_PROFILES[0]
+        fields = profile['fields']
+        match_info = {}
+        
+        try:
+            # One pass over the row's cells; the first cell per field wins
+            for cell in row.find_all('td'):
+                for cls in cell.get('class', ()):
+                    field = fields.get(cls)
+                    if field and field not in match_info:
+                        match_info[field] = cell.get_text(strip=True)
+            
+            if not match_info:
+                return None
+            # Keep the profile's column order for CSV output
+            return {field: match_info[field] for field in fields.values() if field in match_info}
+        
+        except Exception as e:
+            print(f"Error parsing match row: {str(e)}")
+            return None
+    
+    def save_to_csv(self, matches: List[Dict], filename: str = 'matches.csv'):
+        """
+        Save scraped matches to CSV file
+        
+        Args:
+            matches: List of match dictionaries
+            filename: Output CSV filename
+        """
+        if not matches:
+            print("No matches to save")
+            return
+        
+        # Columns: every key seen, in first-seen order
+        fieldnames = list(dict.fromkeys(key for match in matches for key in match))
+        with CsvMatchWriter(filename, fieldnames, mode='w') as writer:
+            writer.write_many(matches)
+        print(f"Data saved to {filename}")
+
+
+# Per-process parser used by AsyncSoccerwayScraper.iter_parsed's pool
+_parse_worker_scraper = None
+
+def _init_parse_worker(parser: str, restrict: bool):
+    global _parse_worker_scraper
+    _parse_worker_scraper = BaseSoccerwayScraper(parser=parser, restrict=restrict)
+
+def _parse_in_worker(body: bytes, preferred: Optional[str]) -> Tuple[Optional[str], List[Dict]]:
+    """Parse one page body in a pool process; returns (profile name, matches)"""
+    scraper = _parse_worker_scraper
+    profile, rows = scraper._select_rows(scraper.parse_page(body, matches_only=True), preferred)
+    return (profile['name'] if profile else None), scraper._parse_rows(rows, profile)
+
+
+class SoccerwayScraper(BaseSoccerwayScraper):
+    """
+    A web scraper for extracting football match scores from soccerway.com
+    """
+    
+    def __init__(self, timeout: int = 10, delay: float = 1, parser: str = None, restrict: bool = True,
+                 cache: PageCache = None, retry: RetryPolicy = None, breaker: CircuitBreaker = None,
+                 archive: 'PageArchive' = None):
+        """
+        Initialize the scraper
+        
+        Args:
+            timeout: Request timeout in seconds
+            delay: Delay between requests in seconds (be respectful)
+            parser: BeautifulSoup tree builder (see PARSER_BACKENDS); lxml when installed
+            restrict: Build only match rows into the tree when extracting matches
+                (fetch_page still returns the whole page)
+            cache: Page cache enabling conditional requests and parse skipping
+            retry: Retry policy for transient failures (default: RetryPolicy())
+            breaker: Per-host circuit breaker (default: CircuitBreaker())
+            archive: Store every fetched body here for later re-parsing
+        """
+        super().__init__(timeout, delay, parser, restrict, cache, retry, breaker, archive)
         self.session = requests.Session()
         # Set a realistic user agent
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self.session.headers.update(DEFAULT_HEADERS)
     
     def fetch_page(self, url: str) -> BeautifulSoup:
         """
@@ -41,20 +1063,53 @@ class SoccerwayScraper:
         Returns:
             BeautifulSoup object of the parsed HTML
         """
-        try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            time.sleep(self.delay)  # Be respectful to the server
-            return BeautifulSoup(response.content, 'html.parser')
-        except requests.RequestException as e:
-            raise SoccerwayScraperError(f"Failed to fetch {url}: {str(e)}")
+        body, _ = self.fetch_body(url)
+        return self.parse_page(body)
+    
+    def fetch_body(self, url: str, conditional: bool = False) -> Tuple[Optional[bytes], Dict]:
+        """
+        Fetch a webpage's raw body
+        
+        Args:
+            url: URL to fetch
+            conditional: Revalidate the cached copy (If-None-Match / If-Modified-Since)
+            
+        Returns:
+            (body, validators); body is None when the server answered 304
+        """
+        host = urlparse(url).netloc
+        headers = self.cache.conditional_headers(url) if conditional and self.cache else {}
+        attempt = 0
+        while True:
+            self.breaker.before_request(host)
+            status, retry_after = None, None
+            try:
+                response = self.session.get(url, timeout=self.timeout, headers=headers)
+                time.sleep(self.delay)  # Be respectful to the server
+                if response.status_code == 304:
+                    self.breaker.record_success(host)
+                    return None, {}
+                response.raise_for_status()
+                self.breaker.record_success(host)
+                if self.archive is not None:
+                    self.archive.put(url, response.content)
+                return response.content, response_validators(response.headers)
+            except requests.HTTPError as e:
+                status, retry_after, error = response.status_code, response.headers.get('Retry-After'), str(e)
+            except requests.RequestException as e:
+                error = str(e)
+            time.sleep(self._retry_wait(url, attempt, status, error, retry_after))
+            attempt += 1
     
-    def scrape_matches(self, page_url: str = None) -> List[Dict]:
+    def scrape_matches(self, page_url: str = None, writer: CsvMatchWriter = None,
+                       partition: str = None) -> List[Dict]:
         """
         Scrape match scores from a given page
         
         Args:
             page_url: URL of the page to scrape. If None, uses the main page.
+            writer: Streaming writer the page's matches are appended to
+            partition: Writer partition for this page (a date)
             
         Returns:
             List of dictionaries containing match information
@@ -63,126 +1118,590 @@ class SoccerwayScraper:
             page_url = self.base_url
         
         try:
-            soup = self.fetch_page(page_url)
-            matches = []
-            
-            # Look for match rows - soccerway uses specific class structures
-            # Note: The exact selectors may need adjustment based on current HTML structure
-            match_rows = soup.find_all('div', class_='match-row')
-            
-            if not match_rows:
-                # Try alternative selectors if the first one doesn't work
-                match_rows = soup.find_all('tr', class_='match')
-            
-            for row in match_rows:
-                try:
-                    match_data = self._parse_match_row(row)
-                    if match_data:
-                        matches.append(match_data)
-                except Exception as e:
-                    print(f"Warning: Could not parse match row: {str(e)}")
-                    continue
-            
+            body, validators = self.fetch_body(page_url, conditional=True)
+            if body is None:
+                matches = self.cache.not_modified(page_url)
+            else:
+                matches = self._matches_from_body(page_url, body, validators)
+            if writer is not None:
+                writer.write_many(matches, partition)
             return matches
-        
         except SoccerwayScraperError:
             raise
         except Exception as e:
             raise SoccerwayScraperError(f"Error scraping matches: {str(e)}")
     
-    def _parse_match_row(self, row) -> Dict:
+    def scrape_by_date(self, date_str: str, writer: CsvMatchWriter = None) -> List[Dict]:
         """
-        Parse a single match row to extract relevant information
+        Scrape matches for a specific date
         
         Args:
-            row: BeautifulSoup element representing a match
+            date_str: Date string (format: YYYY-MM-DD)
+            writer: Streaming writer; rows go to the date's partition
             
         Returns:
-            Dictionary with match information or None if parsing fails
+            List of matches on that date
         """
-        match_info = {}
+        return self.scrape_matches(self.date_url(date_str), writer, date_str)
+    
+    def scrape_by_league(self, league_id: int, writer: CsvMatchWriter = None) -> List[Dict]:
+        """
+        Scrape matches for a specific league
         
-        try:
-            # Extract time/date
-            time_elem = row.find('td', class_='time')
-            if time_elem:
-                match_info['time'] = time_elem.get_text(strip=True)
-            
-            # Extract home team
-            home_team = row.find('td', class_='team-a')
-            if home_team:
-                match_info['home_team'] = home_team.get_text(strip=True)
-            
-            # Extract away team
-            away_team = row.find('td', class_='team-b')
-            if away_team:
-                match_info['away_team'] = away_team.get_text(strip=True)
+        Args:
+            league_id: Soccerway league ID
+            writer: Streaming writer (unpartitioned) the matches are appended to
             
-            # Extract score
-            score = row.find('td', class_='score')
-            if score:
-                match_info['score'] = score.get_text(strip=True)
+        Returns:
+            List of matches in that league
+        """
+        return self.scrape_matches(self.league_url(league_id), writer)
+    
+    def close(self):
+        """Close the session, save the page cache and close the archive"""
+        self.session.close()
+        if self.cache is not None:
+            self.cache.save()
+        if self.archive is not None:
+            self.archive.close()
+
+
+class TokenBucket:
+    """
+    Async token bucket: `rate` requests per second, bursts of up to `capacity`
+    """
+    
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncSoccerwayScraper(BaseSoccerwayScraper):
+    """
+    Concurrent soccerway.com scraper built on a pooled aiohttp session
+    
+    Requests to one host are paced by a token bucket (one request per
+    `delay` seconds) instead of sleeping after each response, so waiting on
+    the network overlaps across pages. Use as an async context manager:
+    
+        async with AsyncSoccerwayScraper(delay=2) as scraper:
+            results = await scraper.scrape_many(urls)
+    """
+    
+    def __init__(self, timeout: int = 10, delay: float = 1, max_concurrency: int = 8,
+                 per_host: int = 2, burst: int = 1, parser: str = None, restrict: bool = True,
+                 cache: PageCache = None, retry: RetryPolicy = None, breaker: CircuitBreaker = None,
+                 archive: 'PageArchive' = None):
+        """
+        Initialize the scraper
+        
+        Args:
+            timeout: Request timeout in seconds
+            delay: Minimum average interval between requests to one host in seconds
+            max_concurrency: Maximum requests in flight overall
+            per_host: Maximum requests in flight per host
+            burst: Requests a host may receive back to back before pacing applies
+            parser: BeautifulSoup tree builder (see PARSER_BACKENDS); lxml when installed
+            restrict: Build only match rows into the tree when extracting matches
+                (fetch_page still returns the whole page)
+            cache: Page cache enabling conditional requests and parse skipping
+            retry: Retry policy for transient failures (default: RetryPolicy())
+            breaker: Per-host circuit breaker (default: CircuitBreaker())
+            archive: Store every fetched body here for later re-parsing
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise SoccerwayScraperError("AsyncSoccerwayScraper requires aiohttp")
+        super().__init__(timeout, delay, parser, restrict, cache, retry, breaker, archive)
+        self.max_concurrency = max_concurrency
+        self.per_host = per_host
+        self.burst = burst
+        self.session = None
+        self._buckets = {}
+        self._semaphore = None
+        # One thread, so archive writes stay ordered without locking PageArchive
+        self._archive_executor = None
+    
+    async def __aenter__(self):
+        await self.open()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    async def open(self):
+        """Create the pooled HTTP session"""
+        if self.session is None:
+            import aiohttp
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.per_host)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers=DEFAULT_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            if self.archive is not None:
+                self._archive_executor = ThreadPoolExecutor(max_workers=1)
+    
+    def _bucket(self, url: str) -> Optional[TokenBucket]:
+        if not self.delay:
+            return None
+        host = urlparse(url).netloc
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(1 / self.delay, self.burst)
+        return self._buckets[host]
+    
+    async def fetch_page(self, url: str) -> BeautifulSoup:
+        """
+        Fetch and parse a webpage, respecting the per-host rate limit
+        
+        Args:
+            url: URL to fetch
             
-            # Extract league/competition
-            league = row.find('td', class_='tournament')
-            if league:
-                match_info['league'] = league.get_text(strip=True)
+        Returns:
+            BeautifulSoup object of the parsed HTML
+        """
+        body, _ = await self.fetch_body(url)
+        return self.parse_page(body)
+    
+    async def fetch_body(self, url: str, conditional: bool = False) -> Tuple[Optional[bytes], Dict]:
+        """
+        Fetch a webpage's raw body, respecting the per-host rate limit
+        
+        Args:
+            url: URL to fetch
+            conditional: Revalidate the cached copy (If-None-Match / If-Modified-Since)
             
-            return match_info if match_info else None
+        Returns:
+            (body, validators); body is None when the server answered 304
+        """
+        await self.open()
+        import aiohttp
+        host = urlparse(url).netloc
+        bucket = self._bucket(url)
+        headers = self.cache.conditional_headers(url) if conditional and self.cache else {}
+        attempt = 0
+        while True:
+            self.breaker.before_request(host)
+            status, retry_after = None, None
+            try:
+                # Wait for the host's token first so a paced host never holds a slot
+                if bucket:
+                    await bucket.acquire()
+                async with self._semaphore:
+                    async with self.session.get(url, headers=headers) as response:
+                        if response.status == 304:
+                            self.breaker.record_success(host)
+                            return None, {}
+                        if response.status < 400:
+                            body = await response.read()
+                            self.breaker.record_success(host)
+                            validators = response_validators(response.headers)
+                            break
+                        status, retry_after = response.status, response.headers.get('Retry-After')
+                        error = f"{response.status} {response.reason}"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = str(e) or type(e).__name__
+            await asyncio.sleep(self._retry_wait(url, attempt, status, error, retry_after))
+            attempt += 1
         
-        except Exception as e:
-            print(f"Error parsing match row: {str(e)}")
-            return None
+        if self.archive is not None:
+            # Compression and file writes would stall every other fetch on the event loop
+            await asyncio.get_running_loop().run_in_executor(self._archive_executor, self.archive.put, url, body)
+        return body, validators
     
-    def scrape_by_date(self, date_str: str) -> List[Dict]:
+    async def scrape_matches(self, page_url: str = None, writer: CsvMatchWriter = None,
+                             partition: str = None) -> List[Dict]:
         """
-        Scrape matches for a specific date
+        Scrape match scores from a given page
         
         Args:
-            date_str: Date string (format: YYYY-MM-DD)
+            page_url: URL of the page to scrape. If None, uses the main page.
+            writer: Streaming writer the page's matches are appended to
+            partition: Writer partition for this page (a date)
             
         Returns:
-            List of matches on that date
+            List of dictionaries containing match information
         """
-        # Construct URL for specific date
-        url = f"{self.base_url}/match/?date={date_str}"
-        return self.scrape_matches(url)
+        if page_url is None:
+            page_url = self.base_url
+        
+        try:
+            body, validators = await self.fetch_body(page_url, conditional=True)
+            if body is None:
+                matches = self.cache.not_modified(page_url)
+            else:
+                matches = self._matches_from_body(page_url, body, validators)
+            if writer is not None:
+                writer.write_many(matches, partition)
+            return matches
+        except SoccerwayScraperError:
+            raise
+        except Exception as e:
+            raise SoccerwayScraperError(f"Error scraping matches: {str(e)}")
+    
+    async def scrape_by_date(self, date_str: str, writer: CsvMatchWriter = None) -> List[Dict]:
+        """Scrape matches for a specific date (format: YYYY-MM-DD) into the date's partition"""
+        return await self.scrape_matches(self.date_url(date_str), writer, date_str)
+    
+    async def scrape_by_league(self, league_id: int, writer: CsvMatchWriter = None) -> List[Dict]:
+        """Scrape matches for a specific Soccerway league ID"""
+        return await self.scrape_matches(self.league_url(league_id), writer)
     
-    def scrape_by_league(self, league_id: int) -> List[Dict]:
+    async def scrape_many(self, urls: List[str], return_exceptions: bool = False) -> List:
         """
-        Scrape matches for a specific league
+        Scrape several pages concurrently
         
         Args:
-            league_id: Soccerway league ID
+            urls: Page URLs; duplicates are fetched once
+            return_exceptions: Return a failed page's SoccerwayScraperError in
+                its slot instead of raising it
             
         Returns:
-            List of matches in that league
+            One list of matches (or exception) per URL, in input order
         """
-        url = f"{self.base_url}/national/tournament/{league_id}/"
-        return self.scrape_matches(url)
+        unique = list(dict.fromkeys(urls))
+        results = await asyncio.gather(
+            *(self.scrape_matches(url) for url in unique),
+            return_exceptions=return_exceptions
+        )
+        by_url = dict(zip(unique, results))
+        return [by_url[url] for url in urls]
     
-    def save_to_csv(self, matches: List[Dict], filename: str = 'matches.csv'):
+    async def iter_parsed(self, urls: List[str], workers: int = None, queue_size: int = None,
+                          return_exceptions: bool = False):
         """
-        Save scraped matches to CSV file
+        Fetch pages concurrently and parse them in a process pool
+        
+        Fetching stays on the event loop while HTML parsing and row
+        extraction run in `workers` processes. Fetched bodies wait in a
+        queue of `queue_size`, so fetching pauses when parsing falls behind.
+        Profile memory, drift checks and the page cache are updated here in
+        the main process, so they behave as with scrape_matches().
         
         Args:
-            matches: List of match dictionaries
-            filename: Output CSV filename
+            urls: Page URLs
+            workers: Parser processes (default: CPU count)
+            queue_size: Bodies waiting for a parser at most (default: 2 per worker)
+            return_exceptions: Yield a failed page's SoccerwayScraperError
+                instead of raising it
+            
+        Yields:
+            (url, matches) per URL, in input order
         """
-        if not matches:
-            print("No matches to save")
-            return
+        urls = list(urls)
+        workers = workers or os.cpu_count() or 1
+        loop = asyncio.get_running_loop()
+        pending_urls = asyncio.Queue()
+        for item in enumerate(urls):
+            pending_urls.put_nowait(item)
+        bodies = asyncio.Queue(maxsize=queue_size or 2 * workers)
+        completed = asyncio.Queue()
+        await self.open()
         
-        df = pd.DataFrame(matches)
-        df.to_csv(filename, index=False)
-        print(f"Data saved to {filename}")
+        async def fetch():
+            while not pending_urls.empty():
+                index, url = pending_urls.get_nowait()
+                try:
+                    body, validators = await self.fetch_body(url, conditional=True)
+                    if body is None:
+                        completed.put_nowait((index, self.cache.not_modified(url)))
+                        continue
+                except Exception as e:
+                    completed.put_nowait((index, e if isinstance(e, SoccerwayScraperError)
+                                          else SoccerwayScraperError(f"Error scraping {url}: {e}")))
+                    continue
+                digest = None
+                if self.cache is not None:
+                    digest = body_hash(body)
+                    cached = self.cache.lookup(url, digest, validators)
+                    if cached is not None:
+                        completed.put_nowait((index, cached))
+                        continue
+                await bodies.put((index, url, body, validators, digest))
+        
+        async def fetch_all():
+            await asyncio.gather(*(fetch() for _ in range(min(self.max_concurrency, len(urls)) or 1)))
+            for _ in range(workers):
+                await bodies.put(None)
+        
+        async def parse(pool):
+            while True:
+                item = await bodies.get()
+                if item is None:
+                    return
+                index, url, body, validators, digest = item
+                pattern = url_pattern(url)
+                try:
+                    name, matches = await loop.run_in_executor(
+                        pool, _parse_in_worker, body, self.profile_by_pattern.get(pattern))
+                except Exception as e:
+                    completed.put_nowait((index, SoccerwayScraperError(f"Error parsing {url}: {e}")))
+                    continue
+                self._record_yield(url, pattern, name, len(matches))
+                if self.cache is not None:
+                    self.cache.store(url, digest, validators, matches)
+                completed.put_nowait((index, matches))
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_parse_worker,
+                                 initargs=(self.parser, self.restrict)) as pool:
+            tasks = [asyncio.ensure_future(fetch_all())]
+            tasks += [asyncio.ensure_future(parse(pool)) for _ in range(workers)]
+            try:
+                # Pages finish out of order; hold them back until their turn
+                finished = {}
+                next_index = 0
+                while next_index < len(urls):
+                    index, result = await completed.get()
+                    finished[index] = result
+                    while next_index in finished:
+                        result = finished.pop(next_index)
+                        if isinstance(result, Exception) and not return_exceptions:
+                            raise result
+                        yield urls[next_index], result
+                        next_index += 1
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
     
-    def close(self):
-        """Close the session"""
-        self.session.close()
+    async def close(self):
+        """Close the session, save the page cache and close the archive"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        if self.cache is not None:
+            self.cache.save()
+        if self._archive_executor is not None:
+            self._archive_executor.shutdown(wait=True)
+            self._archive_executor = None
+        if self.archive is not None:
+            self.archive.close()
+
+
+def date_range(start: str, end: str) -> List[str]:
+    """Every date from start to end inclusive (format: YYYY-MM-DD)"""
+    first = datetime.strptime(start, '%Y-%m-%d').date()
+    last = datetime.strptime(end, '%Y-%m-%d').date()
+    return [(first + timedelta(days=i)).isoformat() for i in range((last - first).days + 1)]
+
+def load_checkpoint(path: str) -> set:
+    """Dates a previous backfill completed"""
+    if not os.path.exists(path):
+        return set()
+    with open(path, 'r', encoding='utf-8') as f:
+        return {line.strip() for line in f if line.strip()}
+
+async def backfill(start: str, end: str, out_dir: str, fmt: str = 'csv', checkpoint: str = None,
+                   delay: float = 2, max_concurrency: int = 4, per_host: int = 2,
+                   cache: PageCache = None, normalize: bool = False, workers: int = 0,
+                   archive: PageArchive = None) -> Dict:
+    """
+    Scrape every date in a range into per-day partitions, resumably
+    
+    Dates are fetched concurrently within the scraper's rate limits. A date
+    is appended to the checkpoint file only once its partition is fully
+    written, so an interrupted run resumes with the dates it had not
+    finished; their partial partitions are rewritten from scratch.
+    
+    Args:
+        start: First date (format: YYYY-MM-DD)
+        end: Last date, inclusive
+        out_dir: Output directory of date=<day> partitions
+        fmt: 'csv' or 'parquet'
+        checkpoint: Checkpoint file (default: <out_dir>/_checkpoint.txt)
+        delay: Minimum average interval between requests to one host in seconds
+        max_concurrency: Dates in flight at once
+        per_host: Maximum requests in flight per host
+        cache: Optional page cache
+        normalize: Write rows in the scores.json schema (see normalize_matches)
+        workers: Parse pages in this many processes (see iter_parsed); 0 parses
+            on the event loop
+        archive: Store every fetched body for later re-parsing
+        
+    Returns:
+        Summary with counts of done, skipped and failed dates
+    """
+    checkpoint = checkpoint or os.path.join(out_dir, '_checkpoint.txt')
+    os.makedirs(os.path.dirname(checkpoint) or '.', exist_ok=True)
+    done = load_checkpoint(checkpoint)
+    dates = date_range(start, end)
+    pending = [d for d in dates if d not in done]
+    summary = {'dates': len(dates), 'skipped': len(dates) - len(pending), 'done': 0, 'failed': {}, 'rows': 0}
+    if not pending:
+        return summary
+    
+    writer_cls = ParquetMatchWriter if fmt == 'parquet' else CsvMatchWriter
+    queue = asyncio.Queue()
+    for date_str in pending:
+        queue.put_nowait(date_str)
+    
+    fieldnames = SCORES_FIELDS if normalize else list(MATCH_CELLS.values())
+    with writer_cls(out_dir, fieldnames=fieldnames, partitioned=True) as writer, \
+            open(checkpoint, 'a', encoding='utf-8') as checkpoint_file:
+        async with AsyncSoccerwayScraper(delay=delay, max_concurrency=max_concurrency,
+                                         per_host=per_host, cache=cache, archive=archive) as scraper:
+            def fail(date_str, error):
+                writer.reset_partition(date_str)
+                summary['failed'][date_str] = str(error)
+                print(f"Warning: {date_str} failed: {error}")
+            
+            def finish(date_str, matches):
+                writer.close_partition(date_str)
+                checkpoint_file.write(date_str + '\n')
+                checkpoint_file.flush()
+                summary['done'] += 1
+                summary['rows'] += len(matches)
+                if summary['done'] % 25 == 0:
+                    print(f"Backfilled {summary['done']}/{len(pending)} dates...")
+            
+            async def worker():
+                while not queue.empty():
+                    date_str = queue.get_nowait()
+                    writer.reset_partition(date_str)
+                    try:
+                        if normalize:
+                            matches = normalize_matches(await scraper.scrape_by_date(date_str), date_str)
+                            writer.write_many(matches, date_str)
+                        else:
+                            matches = await scraper.scrape_by_date(date_str, writer)
+                    except SoccerwayScraperError as e:
+                        fail(date_str, e)
+                        continue
+                    finish(date_str, matches)
+            
+            if workers:
+                urls = [scraper.date_url(date_str) for date_str in pending]
+                index = 0
+                async for _, matches in scraper.iter_parsed(urls, workers, return_exceptions=True):
+                    date_str = pending[index]
+                    index += 1
+                    if isinstance(matches, Exception):
+                        fail(date_str, matches)
+                        continue
+                    if normalize:
+                        matches = normalize_matches(matches, date_str)
+                    writer.reset_partition(date_str)
+                    writer.write_many(matches, date_str)
+                    finish(date_str, matches)
+            else:
+                await asyncio.gather(*(worker() for _ in range(min(max_concurrency, len(pending)))))
+    
+    return summary
+
+def reparse(archive_dir: str, out_dir: str, fmt: str = 'csv', parser: str = None,
+            normalize: bool = False) -> Dict:
+    """
+    Re-extract matches from archived pages, without network traffic
+    
+    Every URL's latest archived body is parsed with the current selector
+    profiles. Date pages are written to their date=<day> partition, other
+    pages to date=undated; partitions are rewritten from scratch.
+    
+    Args:
+        archive_dir: PageArchive directory
+        out_dir: Output directory of date=<day> partitions
+        fmt: 'csv' or 'parquet'
+        parser: BeautifulSoup tree builder (see PARSER_BACKENDS)
+        normalize: Write rows in the scores.json schema (see normalize_matches)
+        
+    Returns:
+        Summary with counts of pages, rows and failed pages
+    """
+    archive = PageArchive(archive_dir)
+    scraper = BaseSoccerwayScraper(parser=parser)
+    summary = {'pages': 0, 'rows': 0, 'failed': {}}
+    
+    writer_cls = ParquetMatchWriter if fmt == 'parquet' else CsvMatchWriter
+    fieldnames = SCORES_FIELDS if normalize else list(MATCH_CELLS.values())
+    seen_partitions = set()
+    with writer_cls(out_dir, fieldnames=fieldnames, partitioned=True) as writer:
+        for url, entry in archive.index.items():
+            date_str = dict(parse_qsl(urlparse(url).query)).get('date')
+            partition = date_str or 'undated'
+            if partition not in seen_partitions:
+                writer.reset_partition(partition)
+                seen_partitions.add(partition)
+            try:
+                matches = scraper.parse_matches(scraper.parse_page(archive.get(entry['hash']), matches_only=True), url)
+            except SoccerwayScraperError as e:
+                summary['failed'][url] = str(e)
+                print(f"Warning: {url} failed: {e}")
+                continue
+            if normalize:
+                matches = normalize_matches(matches, date_str)
+            writer.write_many(matches, partition)
+            summary['pages'] += 1
+            summary['rows'] += len(matches)
+    
+    summary['drift_events'] = scraper.drift_events
+    return summary
+
+def main(argv: List[str] = None):
+    """Command line entry point; without a command, runs the example usage"""
+    parser = argparse.ArgumentParser(description="Soccerway match scraper")
+    commands = parser.add_subparsers(dest='command')
+    
+    backfill_parser = commands.add_parser('backfill', help="Scrape a date range into per-day partitions, resumably")
+    backfill_parser.add_argument('--start', required=True, help="First date (YYYY-MM-DD)")
+    backfill_parser.add_argument('--end', required=True, help="Last date, inclusive (YYYY-MM-DD)")
+    backfill_parser.add_argument('--out', default='backfill', help="Output directory (default: backfill)")
+    backfill_parser.add_argument('--format', choices=['csv', 'parquet'], default='csv', help="Partition file format")
+    backfill_parser.add_argument('--checkpoint', default=None, help="Checkpoint file (default: <out>/_checkpoint.txt)")
+    backfill_parser.add_argument('--delay', type=float, default=2, help="Seconds between requests to one host")
+    backfill_parser.add_argument('--concurrency', type=int, default=4, help="Dates in flight at once")
+    backfill_parser.add_argument('--cache', default=None, help="Page cache directory for conditional requests")
+    backfill_parser.add_argument('--normalize', action='store_true', help="Write rows in the scores.json schema")
+    backfill_parser.add_argument('--workers', type=int, default=0,
+                                 help="Parser processes (default: 0, parse in the fetching process)")
+    backfill_parser.add_argument('--archive', default=None, help="Archive fetched pages in this directory")
+    
+    reparse_parser = commands.add_parser('reparse', help="Re-extract matches from archived pages, offline")
+    reparse_parser.add_argument('--archive', required=True, help="Archive directory written by backfill --archive")
+    reparse_parser.add_argument('--out', default='reparsed', help="Output directory (default: reparsed)")
+    reparse_parser.add_argument('--format', choices=['csv', 'parquet'], default='csv', help="Partition file format")
+    reparse_parser.add_argument('--parser', choices=PARSER_BACKENDS, default=None, help="BeautifulSoup tree builder")
+    reparse_parser.add_argument('--normalize', action='store_true', help="Write rows in the scores.json schema")
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == 'backfill':
+        summary = asyncio.run(backfill(
+            args.start, args.end, args.out, args.format, args.checkpoint,
+            delay=args.delay, max_concurrency=args.concurrency,
+            cache=PageCache(args.cache) if args.cache else None,
+            normalize=args.normalize, workers=args.workers,
+            archive=PageArchive(args.archive) if args.archive else None
+        ))
+        print(f"Backfill: {summary['done']} dates done ({summary['rows']} matches), "
+              f"{summary['skipped']} already done, {len(summary['failed'])} failed")
+        if summary['failed']:
+            print("Re-run the same command to retry failed dates.")
+        return
+
+    if args.command == 'reparse':
+        summary = reparse(args.archive, args.out, args.format, args.parser, args.normalize)
+        print(f"Reparse: {summary['pages']} pages ({summary['rows']} matches), "
+              f"{len(summary['failed'])} failed, {len(summary['drift_events'])} drift warnings")
+        return
 
+    example()
 
-def main():
+def example():
     """Example usage of the scraper"""
     
     scraper = SoccerwayScraper(delay=2)  # 2 second delay between requests
@@ -9,7 +9,11 @@ function Standings({ leagueId }) {
             if (!leagueId) return
             setLoading(true)
             try {
-                const response = await fetch(`/.netlify/functions/standings?id=${leagueId}`)
+                // Prefer the scraper's static snapshot, fall back to the live function
+                let response = await fetch(`/data/standings/${leagueId}.json`)
+                if (!response.ok || !response.headers.get("content-type")?.includes("application/json")) {
+                    response = await fetch(`/.netlify/functions/standings?id=${leagueId}`)
+                }
                 if (!response.ok) throw new Error('Failed to fetch standings')
 
                 const contentType = response.headers.get("content-type")
@@ -20,8 +24,16 @@ function Standings({ leagueId }) {
                 }
 
                 const data = await response.json()
-                // Handle different structures (FotMob wrapper returns varied standings formats)
-                const table = data[0]?.table?.all || data.table?.all || []
+                // Normalized payload: columnar `teams` per table
+                const teams = data.tables?.[0]?.teams
+                const table = teams
+                    ? teams.id.map((_, i) => ({
+                        idx: teams.rank[i],
+                        name: teams.name[i],
+                        played: teams.played[i],
+                        pts: teams.pts[i]
+                    }))
+                    : []
                 setStandings(table)
             } catch (err) {
                 console.error('Error fetching standings:', err)
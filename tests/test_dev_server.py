@@ -0,0 +1,43 @@
+"""Smoke check that netlify/dev/server.py loads and serves every function."""
+
+import sys
+import json
+from pathlib import Path
+
+import pytest
+
+DEV_DIR = Path(__file__).resolve().parent.parent / "netlify" / "dev"
+sys.path.insert(0, str(DEV_DIR))
+
+import server  # noqa: E402
+
+
+@pytest.fixture
+def handlers(monkeypatch):
+    monkeypatch.setattr(sys, "path", [server.STUB_DIR] + sys.path)
+    monkeypatch.delitem(sys.modules, "fotmob", raising=False)
+    return server.load_handlers()
+
+
+def test_loads_every_function(handlers):
+    assert sorted(handlers) == ["match_details", "standings"]
+
+
+@pytest.mark.parametrize("name, params", [
+    ("match_details", {"id": "fm-4193490"}),
+    ("standings", {"id": "47"}),
+])
+def test_handlers_answer_from_stub(handlers, name, params):
+    response = handlers[name]({"queryStringParameters": params}, {})
+
+    assert response["statusCode"] == 200, response["body"]
+    assert json.loads(response["body"])
+
+
+def test_batch_keys_results_by_the_ids_sent(handlers):
+    response = handlers["match_details"]({"queryStringParameters": {"ids": "fm-4193490,4193490,nope"}}, {})
+    body = json.loads(response["body"])
+
+    assert sorted(body["matches"]) == ["4193490", "fm-4193490"]
+    assert body["matches"]["fm-4193490"] == body["matches"]["4193490"]
+    assert body["errors"] == {"nope": "Invalid match id format"}
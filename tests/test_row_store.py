@@ -0,0 +1,74 @@
+"""Row store format and its pairing with the persisted BM25 index (ui-ux-pro-max core.py)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / ".agent" / ".shared" / "ui-ux-pro-max" / "scripts"))
+
+import core  # noqa: E402
+
+ROWS = [
+    {"Name": "Glassmorphism", "Notes": "frosted, blur", "Extra": "x"},
+    {"Name": "Brutalism", "Notes": None, "Extra": "y"},
+    {"Name": "Ünïcode ✓", "Notes": "", "Extra": "z"},
+]
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(core, "INDEX_DIR", tmp_path / ".index")
+    csv_path = tmp_path / "styles.csv"
+    csv_path.write_text("Name,Notes\nGlassmorphism,frosted glass blur\nBrutalism,raw bold\n", encoding="utf-8")
+    return csv_path
+
+
+def test_round_trip_keeps_values_and_none_cells():
+    rows = core.RowStore(core._encode_rows(["Name", "Notes"], ROWS, "abc"))
+
+    assert len(rows) == 3
+    assert rows.sha256 == "abc"
+    assert [rows[i] for i in range(3)] == [{"Name": r["Name"], "Notes": r["Notes"]} for r in ROWS]
+    assert rows[-1] == rows[2]
+    with pytest.raises(IndexError):
+        rows[3]
+
+
+def test_round_trip_through_memory_mapped_file(tmp_path):
+    path = tmp_path / "styles.rows"
+    path.write_bytes(core._encode_rows(["Name", "Notes"], ROWS, "abc"))
+
+    rows = core.RowStore.open(path)
+    assert rows[1] == {"Name": "Brutalism", "Notes": None}
+    assert rows[2]["Name"] == "Ünïcode ✓"
+
+
+def test_empty_store():
+    rows = core.RowStore(core._encode_rows([], [], "abc"))
+    assert len(rows) == 0
+
+
+def test_rejects_other_files():
+    with pytest.raises(ValueError):
+        core.RowStore(b"not a row store at all")
+
+
+def test_index_and_rows_are_written_together(data_dir):
+    bm25, rows = core._load_index(data_dir, ["Name", "Notes"], ["Name"])
+    path = core._index_path(data_dir, ["Name", "Notes"], ["Name"])
+
+    assert path.exists() and path.with_suffix(".rows").exists()
+    assert [rows[idx]["Name"] for idx, _ in bm25.score("glass", top_k=1)] == ["Glassmorphism"]
+
+
+def test_rows_from_other_csv_content_force_a_rebuild(data_dir):
+    core._load_index(data_dir, ["Name", "Notes"], ["Name"])
+    rows_path = core._index_path(data_dir, ["Name", "Notes"], ["Name"]).with_suffix(".rows")
+    rows_path.write_bytes(core._encode_rows(["Name"], [{"Name": "Stale"}], "0" * 64))
+
+    _, rows = core._load_index(data_dir, ["Name", "Notes"], ["Name"])
+
+    assert [rows[i]["Name"] for i in range(len(rows))] == ["Glassmorphism", "Brutalism"]
+    assert core.RowStore.open(rows_path).sha256 == core._file_hash(data_dir)
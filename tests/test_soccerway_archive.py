@@ -0,0 +1,62 @@
+"""PageArchive storage and offline reparse of soccerway_scraper."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import soccerway_scraper as sw  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent.parent / 'benchmarks' / 'fixtures' / 'soccerway'
+COMPRESSIONS = ['gzip', pytest.param('zstd', marks=pytest.mark.skipif(not sw.ZSTD_AVAILABLE, reason='zstandard not installed'))]
+
+
+def archived(root, compression, pages):
+    archive = sw.PageArchive(str(root), compression=compression)
+    digests = {url: archive.put(url, body) for url, body in pages.items()}
+    archive.close()
+    return digests
+
+
+def object_path(root, digest):
+    [path] = [p for p in Path(root).rglob(f'{digest}*') if p.is_file()]
+    return path
+
+
+@pytest.mark.parametrize('compression', COMPRESSIONS)
+def test_round_trip(tmp_path, compression):
+    body = b'<html>' + b'x' * 5000 + b'</html>'
+    digest = archived(tmp_path, compression, {'https://example.com/a': body})['https://example.com/a']
+
+    assert sw.PageArchive(str(tmp_path)).get(digest) == body
+
+
+@pytest.mark.parametrize('compression', COMPRESSIONS)
+@pytest.mark.parametrize('damage', [lambda data: data[:len(data) // 2], lambda data: b'garbage' * 10])
+def test_corrupt_object_raises_scraper_error(tmp_path, compression, damage):
+    digest = archived(tmp_path, compression, {'https://example.com/a': b'<html>' + b'x' * 5000})['https://example.com/a']
+    path = object_path(tmp_path, digest)
+    path.write_bytes(damage(path.read_bytes()))
+
+    with pytest.raises(sw.SoccerwayScraperError, match='corrupt|truncated'):
+        sw.PageArchive(str(tmp_path)).get(digest)
+
+
+@pytest.mark.parametrize('compression', COMPRESSIONS)
+def test_reparse_skips_a_corrupt_page(tmp_path, compression):
+    pages = {
+        f'https://www.soccerway.com/match/?date=2026-02-1{i}': fixture.read_bytes()
+        for i, fixture in enumerate(sorted(FIXTURES.glob('*.html')))
+    }
+    digests = archived(tmp_path / 'archive', compression, pages)
+    bad_url = next(iter(pages))
+    path = object_path(tmp_path / 'archive', digests[bad_url])
+    path.write_bytes(path.read_bytes()[:100])
+
+    summary = sw.reparse(str(tmp_path / 'archive'), str(tmp_path / 'out'))
+
+    assert list(summary['failed']) == [bad_url]
+    assert summary['pages'] == len(pages) - 1
+    assert summary['rows'] > 0
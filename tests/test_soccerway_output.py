@@ -0,0 +1,54 @@
+"""CSV output of soccerway_scraper."""
+
+import csv
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import soccerway_scraper as sw  # noqa: E402
+
+needs_pandas = pytest.mark.skipif(not sw.PANDAS_AVAILABLE, reason='pandas not installed')
+
+
+def read_csv(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.reader(f))
+
+
+def test_save_to_csv_overwrites(tmp_path):
+    path = tmp_path / 'matches.csv'
+    scraper = sw.BaseSoccerwayScraper()
+
+    scraper.save_to_csv([{'a': 1, 'b': 2}], str(path))
+    scraper.save_to_csv([{'x': 9}], str(path))
+
+    assert read_csv(path) == [['x'], ['9']]
+
+
+def test_partitioned_writer_appends_across_runs_and_evictions(tmp_path):
+    for run in range(2):
+        with sw.CsvMatchWriter(str(tmp_path), ['a'], partitioned=True, max_open=1) as writer:
+            writer.write({'a': run}, '2026-02-14')
+            writer.write({'a': run}, '2026-02-15')
+            writer.write({'a': run + 10}, '2026-02-14')
+
+    assert read_csv(tmp_path / 'date=2026-02-14' / 'matches.csv') == [['a'], ['0'], ['10'], ['1'], ['11']]
+
+
+@pytest.mark.parametrize('vectorized', [False, pytest.param(True, marks=needs_pandas)])
+@pytest.mark.parametrize('date_str, clock, expected', [
+    ('2026-03-29', '00:30', '2026-03-29T00:30:00+00:00'),
+    ('2026-03-29', '01:30', None),  # skipped by the spring change
+    ('2026-03-29', '02:30', '2026-03-29T01:30:00+00:00'),
+    ('2026-10-25', '01:30', None),  # happens twice in the autumn
+    ('2026-10-25', '02:30', '2026-10-25T02:30:00+00:00'),
+])
+def test_normalize_kickoff_around_dst_changes(vectorized, date_str, clock, expected):
+    row = {'home_team': 'Arsenal', 'away_team': 'Chelsea', 'score': '', 'time': clock}
+
+    [match] = sw.normalize_matches([row], date_str, tz='Europe/London', vectorized=vectorized)
+
+    assert match['time'] == expected
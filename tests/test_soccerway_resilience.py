@@ -0,0 +1,183 @@
+"""RetryPolicy, Retry-After parsing and CircuitBreaker of soccerway_scraper."""
+
+import sys
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import soccerway_scraper as sw  # noqa: E402
+
+URL = 'https://www.soccerway.com/match/?date=2026-02-14'
+HOST = 'www.soccerway.com'
+
+
+class FakeClock:
+    """Stands in for the module's `time`: monotonic() is set by hand, sleep() only records"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(sw, 'time', SimpleNamespace(monotonic=fake.monotonic, sleep=fake.sleep))
+    return fake
+
+
+def response(status, body=b'', headers=None):
+    r = requests.Response()
+    r.status_code = status
+    r.reason = 'Service Unavailable' if status == 503 else 'OK'
+    r.url = URL
+    r._content = body
+    r.headers.update(headers or {})
+    return r
+
+
+def scraper_with(responses, **kwargs):
+    scraper = sw.SoccerwayScraper(delay=0, **kwargs)
+    scraper.session = SimpleNamespace(get=lambda *args, **kw: responses.pop(0), close=lambda: None)
+    return scraper
+
+
+# ============ Retry-After ============
+
+def test_parse_retry_after_seconds():
+    assert sw.parse_retry_after('120') == 120
+    assert sw.parse_retry_after('-5') == 0
+
+
+def test_parse_retry_after_http_date():
+    when = datetime.now(timezone.utc) + timedelta(seconds=90)
+    assert 85 <= sw.parse_retry_after(format_datetime(when, usegmt=True)) <= 90
+
+
+def test_parse_retry_after_past_date_and_garbage():
+    assert sw.parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0
+    assert sw.parse_retry_after('soon') is None
+
+
+def test_wait_prefers_retry_after_capped_by_max_backoff():
+    policy = sw.RetryPolicy(backoff=1, max_backoff=30, jitter=False)
+    assert policy.wait(0, '12') == 12
+    assert policy.wait(0, '600') == 30
+    assert policy.wait(2, 'soon') == 4
+
+
+def test_wait_backoff_without_retry_after():
+    policy = sw.RetryPolicy(backoff=1, max_backoff=5, jitter=False, respect_retry_after=False)
+    assert [policy.wait(a, '12') for a in range(4)] == [1, 2, 4, 5]
+    jittered = sw.RetryPolicy(backoff=1, max_backoff=5)
+    assert all(0 <= jittered.wait(3) <= 5 for _ in range(50))
+
+
+def test_fetch_retries_transient_status_honoring_retry_after(clock):
+    scraper = scraper_with([response(503, headers={'Retry-After': '7'}), response(200, b'<html></html>')],
+                           retry=sw.RetryPolicy(jitter=False))
+
+    body, _ = scraper.fetch_body(URL)
+
+    assert body == b'<html></html>'
+    assert clock.sleeps == [0, 7, 0]  # delay, Retry-After, delay
+    assert scraper.breaker.state(HOST) == 'closed'
+
+
+def test_fetch_gives_up_after_max_retries(clock):
+    scraper = scraper_with([response(503) for _ in range(3)], retry=sw.RetryPolicy(max_retries=2, jitter=False))
+
+    with pytest.raises(sw.SoccerwayScraperError, match='after 3 attempts'):
+        scraper.fetch_body(URL)
+
+
+def test_fetch_does_not_retry_client_errors(clock):
+    scraper = scraper_with([response(404)])
+
+    with pytest.raises(sw.SoccerwayScraperError):
+        scraper.fetch_body(URL)
+    # The host answered, so it does not count against the breaker
+    assert HOST not in scraper.breaker.hosts
+
+
+# ============ Circuit breaker ============
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = sw.CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    for _ in range(2):
+        breaker.record_failure(HOST)
+    assert breaker.state(HOST) == 'closed'
+    breaker.record_failure(HOST)
+
+    assert breaker.state(HOST) == 'open'
+    with pytest.raises(sw.CircuitOpenError):
+        breaker.before_request(HOST)
+
+
+def test_breaker_half_open_trial_success_closes(clock):
+    breaker = sw.CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure(HOST)
+    clock.now += 60
+
+    assert breaker.state(HOST) == 'half-open'
+    breaker.before_request(HOST)  # the one trial
+    with pytest.raises(sw.CircuitOpenError):
+        breaker.before_request(HOST)  # no second trial while the first is out
+    breaker.record_success(HOST)
+
+    assert breaker.state(HOST) == 'closed'
+    breaker.before_request(HOST)
+
+
+def test_breaker_half_open_trial_failure_reopens(clock):
+    breaker = sw.CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.record_failure(HOST)
+    breaker.record_failure(HOST)
+    clock.now += 61
+    breaker.before_request(HOST)
+    breaker.record_failure(HOST)
+
+    assert breaker.state(HOST) == 'open'
+    clock.now += 59
+    assert breaker.state(HOST) == 'open'
+    clock.now += 1
+    assert breaker.state(HOST) == 'half-open'
+
+
+def test_breaker_unreported_trial_expires(clock):
+    breaker = sw.CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure(HOST)
+    clock.now += 60
+    breaker.before_request(HOST)
+    clock.now += 60
+
+    breaker.before_request(HOST)  # a new trial may go out
+
+
+def test_breaker_is_per_host(clock):
+    breaker = sw.CircuitBreaker(failure_threshold=1)
+    breaker.record_failure(HOST)
+
+    breaker.before_request('other.example.com')
+    assert breaker.state('other.example.com') == 'closed'
+
+
+def test_open_breaker_fails_fetch_without_a_request(clock):
+    breaker = sw.CircuitBreaker(failure_threshold=1)
+    breaker.record_failure(HOST)
+    scraper = scraper_with([], breaker=breaker)
+
+    with pytest.raises(sw.CircuitOpenError):
+        scraper.fetch_body(URL)